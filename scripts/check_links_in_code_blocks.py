@@ -19,10 +19,13 @@ from typing import Optional, Sequence
 from link_utils import (
     MAX_LINK_TEXT_LENGTH,
     MAX_URL_LENGTH,
+    RangeIndex,
     find_code_fence_ranges,
-    in_ranges,
 )
 
+# Find markdown links with HTTP URLs
+HTTP_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\((https?://[^)]+)\)")
+
 
 def truncate_with_ellipsis(text: str, max_len: int) -> str:
     """Truncate text and add ellipsis only if it exceeds max_len."""
@@ -43,13 +46,10 @@ def check_file(file_path: Path, verbose: bool = False) -> list[str]:
         return [f"Error reading {file_path}: {e}"]
 
     warnings = []
-    code_ranges = find_code_fence_ranges(content)
-
-    # Find markdown links with HTTP URLs
-    link_pattern = re.compile(r"\[([^\]]+)\]\((https?://[^)]+)\)")
+    code_ranges = RangeIndex(find_code_fence_ranges(content))
 
-    for match in link_pattern.finditer(content):
-        if in_ranges(match.start(), code_ranges):
+    for match in HTTP_LINK_PATTERN.finditer(content):
+        if code_ranges.contains(match.start()):
             line_num = content[: match.start()].count("\n") + 1
             link_text = truncate_with_ellipsis(match.group(1), MAX_LINK_TEXT_LENGTH)
             url = truncate_with_ellipsis(match.group(2), MAX_URL_LENGTH)
@@ -19,19 +19,24 @@ import re
 import sys
 from enum import Enum
 from pathlib import Path
-from typing import Set, Tuple, List, overload, Literal, NamedTuple
+from typing import Iterator, Set, Tuple, List, overload, Literal, NamedTuple
 
 # Import shared link utilities
 from link_utils import (
     CRITICAL_PAGES,
     MIN_PAGE_CONTENT_LENGTH,
+    RangeIndex,
     find_code_fence_ranges,
     find_inline_code_ranges,
-    in_ranges,
 )
 
 WIKI_DIR = Path("wiki")
 
+# Match the "](path.md)" tail of [text](path.md) style links to local markdown
+# files. The ".md" check is a lookahead so a long destination without ")" fails
+# in linear time instead of backtracking through every ".md" occurrence.
+MARKDOWN_DOC_LINK_TAIL_PATTERN = re.compile(r"\]\((\.\.?/(?=[^)]+?\.md)[^)]+)\)")
+
 
 class Severity(Enum):
     """Severity levels for validation messages."""
@@ -111,15 +116,26 @@ def _split_wiki_link_on_pipe(inner: str) -> Tuple[str, str]:
     return (display_text, page_part)
 
 
+def get_code_ranges(content: str) -> RangeIndex:
+    """Return the code fence and inline code ranges that link checks skip."""
+    return RangeIndex(
+        find_code_fence_ranges(content) + find_inline_code_ranges(content)
+    )
+
+
 @overload
 def extract_wiki_links(
-    content: str, include_display_text: Literal[False] = False
+    content: str,
+    include_display_text: Literal[False] = False,
+    skip_ranges: RangeIndex | None = None,
 ) -> List[WikiLink]: ...
 
 
 @overload
 def extract_wiki_links(
-    content: str, include_display_text: Literal[True]
+    content: str,
+    include_display_text: Literal[True],
+    skip_ranges: RangeIndex | None = None,
 ) -> List[WikiLinkWithDisplay]: ...
 
 
@@ -156,8 +172,32 @@ def _parse_wiki_link(inner: str, line_num: int) -> _ParsedWikiLink:
     return _ParsedWikiLink(display_text.strip(), page_name.strip(), anchor, line_num)
 
 
+def _iter_wiki_links(content: str) -> Iterator[Tuple[int, str]]:
+    """Yield (start, inner) for each [[inner]] wiki link in content.
+
+    The inner text runs to the first "]" and must be non-empty and followed
+    by a second "]". Every "[[" before that "]" shares its outcome, so a
+    failed candidate skips past it, keeping runs of "[[" linear.
+    """
+    pos = 0
+    while True:
+        start = content.find("[[", pos)
+        if start == -1:
+            return
+        close = content.find("]", start + 2)
+        if close == -1:
+            return
+        if close > start + 2 and content.startswith("]", close + 1):
+            yield start, content[start + 2 : close]
+            pos = close + 2
+        else:
+            pos = close + 1
+
+
 def extract_wiki_links(
-    content: str, include_display_text: bool = False
+    content: str,
+    include_display_text: bool = False,
+    skip_ranges: RangeIndex | None = None,
 ) -> List[WikiLink] | List[WikiLinkWithDisplay]:
     """Extract wiki-style links from content, skipping code blocks.
 
@@ -171,27 +211,27 @@ def extract_wiki_links(
         content: The content to extract links from.
         include_display_text: If True, returns WikiLinkWithDisplay tuples.
                               If False (default), returns WikiLink tuples.
+        skip_ranges: Precomputed code ranges from get_code_ranges. Computed
+                     from content when omitted.
 
     Returns:
         List of WikiLink or WikiLinkWithDisplay named tuples.
     """
-    # Get code ranges to skip
-    code_ranges = find_code_fence_ranges(content)
-    inline_code_ranges = find_inline_code_ranges(content)
-    skip_ranges = code_ranges + inline_code_ranges
+    if skip_ranges is None:
+        skip_ranges = get_code_ranges(content)
 
-    # Match [[...]] content
-    pattern = re.compile(r"\[\[([^\]]+)\]\]")
-
-    # Parse all links once using the shared helper
+    # Parse all links once using the shared helper, counting newlines only
+    # since the previous link to track line numbers
     parsed_links: List[_ParsedWikiLink] = []
-    for match in pattern.finditer(content):
-        if in_ranges(match.start(), skip_ranges):
+    line_num = 1
+    line_pos = 0
+    for start, inner in _iter_wiki_links(content):
+        if skip_ranges.contains(start):
             continue
 
-        inner = match.group(1).strip()
-        line_num = content[: match.start()].count("\n") + 1
-        parsed_links.append(_parse_wiki_link(inner, line_num))
+        line_num += content.count("\n", line_pos, start)
+        line_pos = start
+        parsed_links.append(_parse_wiki_link(inner.strip(), line_num))
 
     # Convert to the appropriate return type
     if include_display_text:
@@ -203,7 +243,9 @@ def extract_wiki_links(
         return [WikiLink(p.page_name, p.anchor, p.line_num) for p in parsed_links]
 
 
-def find_redundant_links(content: str) -> List[Tuple[str, int]]:
+def find_redundant_links(
+    content: str, skip_ranges: RangeIndex | None = None
+) -> List[Tuple[str, int]]:
     """Find redundant wiki links where display text matches page name.
 
     Links like [[Coroutines|Coroutines]] are redundant and should be [[Coroutines]].
@@ -213,7 +255,9 @@ def find_redundant_links(content: str) -> List[Tuple[str, int]]:
         List of (page_name, line_number) tuples for redundant links.
     """
     # Get links with display text
-    links = extract_wiki_links(content, include_display_text=True)
+    links = extract_wiki_links(
+        content, include_display_text=True, skip_ranges=skip_ranges
+    )
 
     redundant = []
     for link in links:
@@ -225,34 +269,58 @@ def find_redundant_links(content: str) -> List[Tuple[str, int]]:
     return redundant
 
 
-def find_unconverted_links(content: str, file_path: Path) -> List[Tuple[str, int]]:
+def find_unconverted_links(
+    content: str, file_path: Path, skip_ranges: RangeIndex | None = None
+) -> List[Tuple[str, int]]:
     """Find markdown-style links that should have been converted to wiki format.
 
     Returns:
         List of (link, line_number) tuples for links outside code blocks.
     """
-    # Get code ranges to skip
-    code_ranges = find_code_fence_ranges(content)
-    inline_code_ranges = find_inline_code_ranges(content)
-    skip_ranges = code_ranges + inline_code_ranges
+    if skip_ranges is None:
+        skip_ranges = get_code_ranges(content)
 
+    # Count newlines only since the previous link to track line numbers
     unconverted = []
-    # Match [text](path.md) style links to local markdown files
-    pattern = re.compile(r"\[([^\]]+)\]\((\.\.?/[^)]+\.md[^)]*)\)")
-
-    for match in pattern.finditer(content):
-        if in_ranges(match.start(), skip_ranges):
+    line_num = 1
+    line_pos = 0
+    for start, href in _iter_markdown_doc_links(content):
+        if skip_ranges.contains(start):
             continue
-        href = match.group(2)
         # Skip external links
         if href.startswith(("http://", "https://", "mailto:")):
             continue
-        line_num = content[: match.start()].count("\n") + 1
+        line_num += content.count("\n", line_pos, start)
+        line_pos = start
         unconverted.append((href, line_num))
 
     return unconverted
 
 
+def _iter_markdown_doc_links(content: str) -> Iterator[Tuple[int, str]]:
+    """Yield (start, href) for each [text](./path.md) style link in content.
+
+    Every "[" before the same "]" shares that bracket's outcome, so a failed
+    candidate skips past the "]" rather than retrying from the next "[".
+    This keeps runs of unclosed brackets linear.
+    """
+    pos = 0
+    while True:
+        start = content.find("[", pos)
+        if start == -1:
+            return
+        close = content.find("]", start + 1)
+        if close == -1:
+            return
+        if close > start + 1:
+            match = MARKDOWN_DOC_LINK_TAIL_PATTERN.match(content, close)
+            if match:
+                yield start, match.group(1)
+                pos = match.end()
+                continue
+        pos = close + 1
+
+
 def get_wiki_pages() -> Set[str]:
     """Get all wiki page names from the wiki directory."""
     pages = set()
@@ -439,8 +507,11 @@ def validate_wiki(verbose: bool = False) -> int:
             )
             continue
 
+        # Code ranges are shared by all checks on this file
+        skip_ranges = get_code_ranges(content)
+
         # Check wiki links
-        wiki_links = extract_wiki_links(content)
+        wiki_links = extract_wiki_links(content, skip_ranges=skip_ranges)
         total_links += len(wiki_links)
 
         for page_name, anchor, line_num in wiki_links:
@@ -454,7 +525,7 @@ def validate_wiki(verbose: bool = False) -> int:
                 )
 
         # Check for unconverted markdown links
-        unconverted = find_unconverted_links(content, md_file)
+        unconverted = find_unconverted_links(content, md_file, skip_ranges)
         for href, line_num in unconverted:
             warnings.append(
                 format_message(
@@ -464,7 +535,7 @@ def validate_wiki(verbose: bool = False) -> int:
             )
 
         # Check for redundant wiki links like [[X|X]] that should be [[X]]
-        redundant = find_redundant_links(content)
+        redundant = find_redundant_links(content, skip_ranges)
         for page_name, line_num in redundant:
             warnings.append(
                 format_message(
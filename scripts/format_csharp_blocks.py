@@ -13,14 +13,120 @@ formatting rules:
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
 import re
+import sys
+import tempfile
 import traceback
+from collections import OrderedDict
 from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
-from typing import List, Optional, Sequence, Tuple
-
-
-@dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from link_utils import map_in_pool
+
+CSHARP_FENCE_PATTERN = re.compile(r"^```(?:csharp|cs)\s*$")
+
+# Characters every per-line formatting pass needs to find a match ("(" covers
+# the keyword pass); lines without any of them only lose trailing whitespace
+FORMATTABLE_CHAR_PATTERN = re.compile(r"[=,:;&|?+*%(]")
+
+# Openings of string/char literals, longest prefixes first
+LITERAL_START_PATTERN = re.compile(r"\$@\"|@\$\"|@\"|\$\"|\"|'")
+# Literal bodies; an unterminated literal runs to the end of the line
+REGULAR_STRING_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*(?:"|\\)?', re.DOTALL)
+VERBATIM_STRING_PATTERN = re.compile(r'@"(?:[^"]|"")*"?')
+CHAR_LITERAL_PATTERN = re.compile(r"'(?:\\.?|[^'])?'?", re.DOTALL)
+LITERAL_BODY_PATTERNS = {
+    '"': REGULAR_STRING_PATTERN,
+    '@"': VERBATIM_STRING_PATTERN,
+    "'": CHAR_LITERAL_PATTERN,
+}
+# Characters that affect where an interpolated string ends
+INTERPOLATED_SPECIAL_PATTERN = re.compile(r'[{}"\\]')
+
+# All operator spacing in one pass. Lookarounds (instead of consuming the
+# neighbouring characters) let chains like a=b=c or a+b+c space every operator.
+# Alternatives are tried left to right, so compound operators win over "=".
+OPERATOR_PATTERN = re.compile(
+    # Compound and comparison operators between any non-whitespace
+    r"(?<=\S)(?:==|!=|<=|>=|\+=|-=|\*=|/=|&&|\|\||\?\?|=>)(?=\S)"
+    # Single = assignment: word=value; the lookahead skips ==, =>, =! and "= "
+    r"|(?<=\w)=(?=[^\s=><!])"
+    # Binary arithmetic between word characters. - and / are left alone: they
+    # are ambiguous with hyphenated words and paths (Keyboard/W, Packages/NuGet)
+    r"|(?<=\w)[+*%](?=\w)"
+)
+COMMA_NO_SPACE_PATTERN = re.compile(r",(\S)")
+# The (?<!...) lookbehinds only let a match start at the beginning of a run.
+# A match starting mid-run could always have started earlier, so results are
+# unchanged, but a failed attempt no longer rescans the rest of the run from
+# every position in it (quadratic on long whitespace or identifier runs).
+SPACE_BEFORE_SEPARATOR_PATTERN = re.compile(r"(?<!\s)\s+([,;])")
+# Match patterns like: class Foo:Bar, class Foo<T>:Bar<T>, struct Foo:IFoo
+TYPE_DECLARATION_PATTERN = re.compile(
+    r"^\s*(public\s+|private\s+|internal\s+|protected\s+|abstract\s+|"
+    r"sealed\s+|static\s+|partial\s+|readonly\s+)*"
+    r"(class|interface|struct|record)\s+\w+"
+)
+# "} else" / "} else if (...)" lines, split into closing brace, else part and "{"
+ELSE_PATTERN = re.compile(r"^\}\s*(else|else\s+if)")
+ELSE_SPLIT_PATTERN = re.compile(
+    r"^(\})\s*(else\s+if\s*\(.*\)|else\s+if.*|else)\s*(\{)?$"
+)
+# Lines ending in " {" that open an initializer or expression, not a block
+INLINE_BRACE_PATTERN = re.compile(
+    "|".join(
+        re.escape(marker)
+        for marker in (
+            " = new ",  # Object initializer: var x = new Foo {
+            "=> {",  # Lambda with block body
+            "= new(",  # Target-typed new
+            "new[] {",  # Array initializer with elements
+            "new {",  # Anonymous type
+            "new() {",  # Target-typed new with initializer
+            "with {",  # With expressions (C# 9+)
+            "] {",  # After indexer
+            "return new ",  # Return new object
+        )
+    )
+)
+# First words a TYPE_DECLARATION_PATTERN match can start with
+TYPE_DECLARATION_PREFIXES = (
+    "public",
+    "private",
+    "internal",
+    "protected",
+    "abstract",
+    "sealed",
+    "static",
+    "partial",
+    "readonly",
+    "class",
+    "interface",
+    "struct",
+    "record",
+)
+# Match TypeName:BaseType or TypeName<T>:BaseType<T> pattern. Like the
+# whitespace patterns above, (?<!\w) keeps failed matches linear.
+INHERITANCE_COLON_PATTERN = re.compile(r"(?<!\w)(\w+(?:<[^>]+>)?)\s*:\s*(\w+)")
+
+
+MARKDOWN_SUFFIXES = frozenset({".md", ".markdown", ".mdx"})
+
+# Records files already known to need no formatting, keyed by content hash.
+# Kept in the per-user cache directory, not a shared temp dir other users can write
+DEFAULT_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "unity-tips"
+    / "format_csharp_blocks.json"
+)
+
+
+@dataclass(slots=True)
 class CodeBlock:
     file: Path
     line_start: int
@@ -29,18 +135,40 @@ class CodeBlock:
     language: str
 
 
-def extract_csharp_blocks(file: Path) -> List[CodeBlock]:
-    """Extract C# code blocks from a markdown file."""
-    content = file.read_text(encoding="utf-8")
+@dataclass(slots=True)
+class FormatResult:
+    """Outcome of formatting one markdown file, safe to return from a worker."""
+
+    file: Path
+    modified: bool = False
+    blocks_formatted: int = 0
+    error: Optional[str] = None
+    details: Optional[str] = None
+
+
+def extract_csharp_blocks(
+    file: Path, content: Optional[str] = None, lines: Optional[List[str]] = None
+) -> List[CodeBlock]:
+    """Extract C# code blocks from a markdown file.
+
+    Pass content (or its lines, split on "\\n") when the file has already been
+    read to avoid reading and splitting it twice.
+    """
+    if lines is None:
+        if content is None:
+            content = file.read_text(encoding="utf-8")
+        # Every ```csharp or ```cs fence contains this substring
+        if "```cs" not in content:
+            return []
+        lines = content.split("\n")
     blocks: List[CodeBlock] = []
-    lines = content.split("\n")
 
     in_block = False
     block_start = 0
     block_lines: List[str] = []
 
     for i, line in enumerate(lines, 1):
-        if re.match(r"^```(?:csharp|cs)\s*$", line):
+        if CSHARP_FENCE_PATTERN.match(line):
             in_block = True
             block_start = i
             block_lines = []
@@ -77,159 +205,93 @@ class StringLiteralMasker:
     - Each line is processed independently; multi-line strings are not supported.
     """
 
-    def __init__(self):
-        self.literals: List[str] = []
-        # Use a unique placeholder that won't appear in real C# code
-        self.placeholder_prefix = "\x00\x01STRLIT"
-        self.placeholder_suffix = "\x01\x00"
+    # Use a unique placeholder that won't appear in real C# code
+    placeholder_prefix = "\x00\x01STRLIT"
+    placeholder_suffix = "\x01\x00"
+    placeholder_pattern = re.compile(
+        re.escape(placeholder_prefix) + r"(\d+)" + re.escape(placeholder_suffix)
+    )
 
-    def reset(self):
-        """Reset the masker state for a new line."""
-        self.literals = []
+    def __init__(self) -> None:
+        self.literals: List[str] = []
 
     def mask(self, content: str) -> str:
         """Replace string literals with placeholders."""
-        self.literals = []
-        result = []
-        i = 0
-
-        while i < len(content):
-            # Check for verbatim interpolated string $@"..." or @$"..."
-            if i < len(content) - 2 and (
-                (content[i] == "$" and content[i + 1] == "@" and content[i + 2] == '"')
-                or (
-                    content[i] == "@"
-                    and content[i + 1] == "$"
-                    and content[i + 2] == '"'
+        self.literals.clear()
+        if '"' not in content and "'" not in content:
+            return content
+
+        result: List[str] = []
+        pos = 0
+        # Jump between literal openings; text in between is copied unchanged
+        while True:
+            start_match = LITERAL_START_PATTERN.search(content, pos)
+            if start_match is None:
+                break
+
+            start = start_match.start()
+            opener = start_match.group()
+            body_pattern = LITERAL_BODY_PATTERNS.get(opener)
+            if body_pattern is None:
+                # $"..." and $@"..." need brace depth tracking
+                end = self._interpolated_string_end(
+                    content, start_match.end(), verbatim=len(opener) == 3
                 )
-            ):
-                start = i
-                i += 3  # Skip $@" or @$"
-                brace_depth = 0
-                while i < len(content):
-                    if content[i] == "{":
-                        if i + 1 < len(content) and content[i + 1] == "{":
-                            i += 2  # Escaped brace
-                            continue
-                        brace_depth += 1
-                    elif content[i] == "}":
-                        if i + 1 < len(content) and content[i + 1] == "}":
-                            i += 2  # Escaped brace
-                            continue
-                        brace_depth -= 1
-                    elif content[i] == '"' and brace_depth == 0:
-                        # Check for escaped quote "" in verbatim string
-                        if i + 1 < len(content) and content[i + 1] == '"':
-                            i += 2
-                            continue
-                        i += 1  # Include closing quote
-                        break
-                    i += 1
-                literal = content[start:i]
-                placeholder = f"{self.placeholder_prefix}{len(self.literals)}{self.placeholder_suffix}"
-                self.literals.append(literal)
-                result.append(placeholder)
-                continue
+            else:
+                body = body_pattern.match(content, start)
+                end = body.end() if body else start_match.end()
 
-            # Check for verbatim string @"..."
-            if i < len(content) - 1 and content[i] == "@" and content[i + 1] == '"':
-                start = i
-                i += 2  # Skip @"
-                while i < len(content):
-                    if content[i] == '"':
-                        # Check for escaped quote ""
-                        if i + 1 < len(content) and content[i + 1] == '"':
-                            i += 2
-                            continue
-                        i += 1  # Include closing quote
-                        break
-                    i += 1
-                literal = content[start:i]
-                placeholder = f"{self.placeholder_prefix}{len(self.literals)}{self.placeholder_suffix}"
-                self.literals.append(literal)
-                result.append(placeholder)
-                continue
+            result.append(content[pos:start])
+            result.append(
+                f"{self.placeholder_prefix}{len(self.literals)}{self.placeholder_suffix}"
+            )
+            self.literals.append(content[start:end])
+            pos = end
 
-            # Check for interpolated string $"..."
-            if i < len(content) - 1 and content[i] == "$" and content[i + 1] == '"':
-                start = i
-                i += 2  # Skip $"
-                brace_depth = 0
-                while i < len(content):
-                    if content[i] == "{":
-                        if i + 1 < len(content) and content[i + 1] == "{":
-                            i += 2  # Escaped brace
-                            continue
-                        brace_depth += 1
-                    elif content[i] == "}":
-                        if i + 1 < len(content) and content[i + 1] == "}":
-                            i += 2  # Escaped brace
-                            continue
-                        brace_depth -= 1
-                    elif content[i] == '"' and brace_depth == 0:
-                        i += 1  # Include closing quote
-                        break
-                    elif content[i] == "\\" and i + 1 < len(content):
-                        i += 2  # Skip escaped char
-                        continue
-                    i += 1
-                literal = content[start:i]
-                placeholder = f"{self.placeholder_prefix}{len(self.literals)}{self.placeholder_suffix}"
-                self.literals.append(literal)
-                result.append(placeholder)
-                continue
+        result.append(content[pos:])
+        return "".join(result)
 
-            # Check for regular string "..."
-            if content[i] == '"':
-                start = i
-                i += 1  # Skip opening quote
-                while i < len(content):
-                    if content[i] == '"':
-                        i += 1  # Include closing quote
-                        break
-                    elif content[i] == "\\" and i + 1 < len(content):
-                        i += 2  # Skip escaped char
-                        continue
-                    i += 1
-                literal = content[start:i]
-                placeholder = f"{self.placeholder_prefix}{len(self.literals)}{self.placeholder_suffix}"
-                self.literals.append(literal)
-                result.append(placeholder)
-                continue
+    @staticmethod
+    def _interpolated_string_end(content: str, i: int, verbatim: bool) -> int:
+        """Return the index just past an interpolated string body starting at i.
 
-            # Check for character literal '.'
-            # Handle: 'a', '\n', '\x00', empty '' (invalid but don't crash)
-            if content[i] == "'":
-                start = i
-                i += 1
-                # Handle escaped characters like '\n', '\t', '\x00'
-                if i < len(content) and content[i] == "\\":
-                    i += 1  # Skip backslash
-                    if i < len(content):
-                        i += 1  # Skip escaped char
-                # Handle regular single character
-                elif i < len(content) and content[i] != "'":
-                    i += 1  # Skip char
-                # Check for closing quote (handles empty '' case too)
-                if i < len(content) and content[i] == "'":
-                    i += 1  # Include closing quote
-                literal = content[start:i]
-                placeholder = f"{self.placeholder_prefix}{len(self.literals)}{self.placeholder_suffix}"
-                self.literals.append(literal)
-                result.append(placeholder)
+        Quotes only close the string outside of {...} holes. Doubled braces are
+        escapes; verbatim strings escape quotes as "" and regular ones use \\.
+        Unterminated strings run to the end of the line.
+        """
+        length = len(content)
+        brace_depth = 0
+        while True:
+            special = INTERPOLATED_SPECIAL_PATTERN.search(content, i)
+            if special is None:
+                return length
+            i = special.start()
+            char = content[i]
+            if char == "{" or char == "}":
+                if i + 1 < length and content[i + 1] == char:
+                    i += 2  # Escaped brace
+                    continue
+                brace_depth += 1 if char == "{" else -1
+            elif char == '"':
+                if brace_depth == 0:
+                    # Check for escaped quote "" in verbatim string
+                    if verbatim and i + 1 < length and content[i + 1] == '"':
+                        i += 2
+                        continue
+                    return i + 1  # Include closing quote
+            elif not verbatim and i + 1 < length:
+                i += 2  # Skip escaped char
                 continue
-
-            result.append(content[i])
             i += 1
 
-        return "".join(result)
-
     def unmask(self, content: str) -> str:
         """Restore string literals from placeholders."""
-        for idx, literal in enumerate(self.literals):
-            placeholder = f"{self.placeholder_prefix}{idx}{self.placeholder_suffix}"
-            content = content.replace(placeholder, literal)
-        return content
+        if not self.literals:
+            return content
+        literals = self.literals
+        return self.placeholder_pattern.sub(
+            lambda match: literals[int(match.group(1))], content
+        )
 
 
 class CSharpFormatter:
@@ -237,20 +299,22 @@ class CSharpFormatter:
 
     # Keywords that should have space after them before (
     # Note: nameof, typeof, sizeof, default do NOT get spaces in C#
-    KEYWORDS_WITH_SPACE = {
-        "if",
-        "for",
-        "foreach",
-        "while",
-        "do",
-        "switch",
-        "catch",
-        "using",
-        "lock",
-        "fixed",
-        "checked",
-        "unchecked",
-    }
+    KEYWORDS_WITH_SPACE = frozenset(
+        {
+            "if",
+            "for",
+            "foreach",
+            "while",
+            "do",
+            "switch",
+            "catch",
+            "using",
+            "lock",
+            "fixed",
+            "checked",
+            "unchecked",
+        }
+    )
 
     # Shell commands that should not be formatted
     SHELL_PREFIXES = (
@@ -264,6 +328,17 @@ class CSharpFormatter:
         "ls ",
     )
 
+    # Declaration prefixes that start a new class member
+    MEMBER_PREFIXES = (
+        "public ",
+        "private ",
+        "protected ",
+        "internal ",
+        "static ",
+        "void ",
+        "async ",
+    )
+
     # Patterns indicating a code block is a "before" example that should stay unformatted
     BEFORE_EXAMPLE_PATTERNS = (
         "let CSharpier fix it",
@@ -278,12 +353,32 @@ class CSharpFormatter:
         "same output after save",
     )
 
-    def __init__(self):
+    # Maximum number of formatted blocks remembered by format_code
+    FORMAT_CACHE_SIZE = 4096
+
+    def __init__(self) -> None:
         self.indent_size = 4
         self.masker = StringLiteralMasker()
+        self._format_cache: OrderedDict[str, str] = OrderedDict()
 
     def format_code(self, code: str) -> str:
-        """Format C# code using CSharpier-like rules."""
+        """Format C# code using CSharpier-like rules.
+
+        Results are cached per input so repeated snippets are only formatted once.
+        """
+        cached = self._format_cache.get(code)
+        if cached is not None:
+            self._format_cache.move_to_end(code)
+            return cached
+
+        formatted = self._format_code_uncached(code)
+        self._format_cache[code] = formatted
+        if len(self._format_cache) > self.FORMAT_CACHE_SIZE:
+            self._format_cache.popitem(last=False)
+        return formatted
+
+    def _format_code_uncached(self, code: str) -> str:
+        """Apply all formatting passes to a code block."""
         if not code.strip():
             return code
 
@@ -291,23 +386,18 @@ class CSharpFormatter:
         if self._should_skip_block(code):
             return code
 
-        # Normalize line endings
-        code = code.replace("\r\n", "\n").replace("\r", "\n")
+        # Normalize line endings (most blocks are already LF-only)
+        if "\r" in code:
+            code = code.replace("\r\n", "\n").replace("\r", "\n")
 
         # Apply formatting passes - each line independently
-        lines = code.split("\n")
-        result_lines = []
-
-        for line in lines:
-            formatted_line = self._format_line(line)
-            result_lines.append(formatted_line)
+        lines = [self._format_line(line) for line in code.split("\n")]
 
-        # Join and apply multi-line formatting
-        code = "\n".join(result_lines)
-        code = self._format_braces_allman(code)
-        code = self._ensure_blank_lines_between_members(code)
+        # Apply multi-line formatting on the same line list, joining only once
+        lines = self._format_braces_allman(lines)
+        lines = self._ensure_blank_lines_between_members(lines)
 
-        return code
+        return "\n".join(lines)
 
     def _should_skip_block(self, code: str) -> bool:
         """Check if this code block should be skipped."""
@@ -317,7 +407,7 @@ class CSharpFormatter:
             return True
 
         first_line = lines[0]
-        if any(first_line.startswith(p) for p in self.SHELL_PREFIXES):
+        if first_line.startswith(self.SHELL_PREFIXES):
             return True
 
         # Skip very short code blocks (usually fragments)
@@ -342,20 +432,19 @@ class CSharpFormatter:
         content = line.strip()
 
         # Skip comment lines entirely
-        if (
-            content.startswith("//")
-            or content.startswith("/*")
-            or content.startswith("*")
-        ):
+        if content.startswith(("//", "/*", "*")):
             return line
 
         # Skip shell command lines
-        if any(content.startswith(prefix) for prefix in self.SHELL_PREFIXES):
+        if content.startswith(self.SHELL_PREFIXES):
             return line
 
-        # Reset and mask string literals FIRST
+        # Nothing below can change a line without one of these characters
+        if not FORMATTABLE_CHAR_PATTERN.search(content):
+            return indent_str + content
+
+        # Mask string literals FIRST (mask() resets the masker's state)
         # This allows proper detection of // comments (not in strings like URLs)
-        self.masker.reset()
         masked_content = self.masker.mask(content)
 
         # Now split into code and comment parts (after masking)
@@ -366,7 +455,7 @@ class CSharpFormatter:
         code_part = self._format_operators_in_line(code_part)
         code_part = self._format_commas_in_line(code_part)
         code_part = self._format_inheritance_colon(code_part)
-        code_part = self._remove_space_before_semicolon(code_part)
+        code_part = self._remove_space_before_separators(code_part)
 
         # Rejoin code and comment (still masked)
         if comment_part:
@@ -381,67 +470,25 @@ class CSharpFormatter:
 
     def _format_keywords_in_line(self, content: str) -> str:
         """Add space after keywords before parentheses."""
-        for keyword in self.KEYWORDS_WITH_SPACE:
-            # Pattern: keyword immediately followed by (
-            pattern = rf"\b({keyword})\("
-            replacement = rf"\1 ("
-            content = re.sub(pattern, replacement, content)
-        return content
+        if "(" not in content:
+            return content
+        # Pattern: keyword immediately followed by (
+        return KEYWORD_PAREN_PATTERN.sub(r"\1 (", content)
 
     def _format_operators_in_line(self, content: str) -> str:
         """Add spaces around assignment, comparison, and arithmetic operators."""
-        # Add spaces around compound and comparison operators first (before single-char ops)
-        # Each tuple is (pattern, replacement) - patterns use \S to match non-whitespace
-        operators = [
-            (r"(\S)==(\S)", r"\1 == \2"),
-            (r"(\S)!=(\S)", r"\1 != \2"),
-            (r"(\S)<=(\S)", r"\1 <= \2"),
-            (r"(\S)>=(\S)", r"\1 >= \2"),
-            (r"(\S)\+=(\S)", r"\1 += \2"),
-            (r"(\S)-=(\S)", r"\1 -= \2"),
-            (r"(\S)\*=(\S)", r"\1 *= \2"),
-            (r"(\S)/=(\S)", r"\1 /= \2"),
-            (r"(\S)&&(\S)", r"\1 && \2"),
-            (r"(\S)\|\|(\S)", r"\1 || \2"),
-            (r"(\S)\?\?(\S)", r"\1 ?? \2"),
-            (r"(\S)=>(\S)", r"\1 => \2"),
-        ]
-
-        for pattern, replacement in operators:
-            content = re.sub(pattern, replacement, content)
-
-        # Handle single = assignment: word=value -> word = value
-        # Compound operators (+=, ==, etc.) are already handled above.
-        # The lookahead (?![=><!]) defensively avoids matching ==, =>, <=, != even if
-        # the compound patterns didn't match (e.g., due to unusual spacing).
-        # Note: \w only matches [a-zA-Z0-9_], so no lookbehind needed for operators.
-        # Loop to handle chained assignments like a=b=c=0 (needs multiple passes).
-        assignment_pattern = re.compile(r"(\w)=(?![=><!])([^\s=])")
-        while assignment_pattern.search(content):
-            content = assignment_pattern.sub(r"\1 = \2", content)
-
-        # Handle binary arithmetic operators
-        # + is safe between any word characters
-        content = re.sub(r"(\w)\+(\w)", r"\1 + \2", content)
-        # Note: We don't format - operator because it's ambiguous:
-        # - Hyphenated words in comments are already excluded (comments split out)
-        # - But expressions like "value-1" vs "Read-only" can't be reliably distinguished
-        # - Since - is not valid in C# identifiers, actual subtraction like "a-b" in code
-        #   should be written with spaces by the developer for clarity
-        # * and % are safe - they're not used in paths/identifiers
-        content = re.sub(r"(\w)\*(\w)", r"\1 * \2", content)
-        content = re.sub(r"(\w)%(\w)", r"\1 % \2", content)
-        # Don't format / - too ambiguous (paths: Keyboard/W, Packages/NuGet)
-
-        return content
+        return OPERATOR_PATTERN.sub(r" \g<0> ", content)
 
     def _format_commas_in_line(self, content: str) -> str:
-        """Ensure space after commas in code (not in strings - those are masked)."""
+        """Ensure space after commas in code (not in strings - those are masked).
+
+        Space before commas is removed together with space before semicolons in
+        _remove_space_before_separators.
+        """
+        if "," not in content:
+            return content
         # Add space after comma if not followed by space
-        content = re.sub(r",(\S)", r", \1", content)
-        # Remove space before comma
-        content = re.sub(r"\s+,", ",", content)
-        return content
+        return COMMA_NO_SPACE_PATTERN.sub(r", \1", content)
 
     def _split_code_and_comment(self, content: str) -> Tuple[str, str]:
         """Split a line into code and comment parts.
@@ -467,67 +514,64 @@ class CSharpFormatter:
 
         Note: Comments are already split out before this method is called.
         """
+        if ":" not in content:
+            return content
+        # Cheap prefix check before running the full declaration regex
+        if not content.lstrip().startswith(TYPE_DECLARATION_PREFIXES):
+            return content
         # Only format if line contains a type declaration keyword
-        # Match patterns like: class Foo:Bar, class Foo<T>:Bar<T>, struct Foo:IFoo
-        if re.match(
-            r"^\s*(public\s+|private\s+|internal\s+|protected\s+|abstract\s+|"
-            r"sealed\s+|static\s+|partial\s+|readonly\s+)*"
-            r"(class|interface|struct|record)\s+\w+",
-            content,
-        ):
-            # Match TypeName:BaseType or TypeName<T>:BaseType<T> pattern
+        if TYPE_DECLARATION_PATTERN.match(content):
             # Handle generic types in both the class name and base type
-            content = re.sub(
-                r"(\w+(?:<[^>]+>)?)\s*:\s*(\w+)",
-                r"\1 : \2",
-                content,
-            )
+            content = INHERITANCE_COLON_PATTERN.sub(r"\1 : \2", content)
         return content
 
-    def _remove_space_before_semicolon(self, content: str) -> str:
-        """Remove space before semicolon."""
-        return re.sub(r"\s+;", ";", content)
+    def _remove_space_before_separators(self, content: str) -> str:
+        """Remove space before commas and semicolons in a single pass."""
+        if "," not in content and ";" not in content:
+            return content
+        return SPACE_BEFORE_SEPARATOR_PATTERN.sub(r"\1", content)
 
-    def _format_braces_allman(self, code: str) -> str:
+    def _format_braces_allman(self, lines: List[str]) -> List[str]:
         """Convert K&R braces to Allman style."""
-        lines = code.split("\n")
-        result = []
+        result: List[str] = []
+        append = result.append
 
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            stripped = line.strip()
-            indent = len(line) - len(line.lstrip())
-            indent_str = " " * indent
+        for line in lines:
+            # Strip each side once; the left strip also gives the indentation
+            lstripped = line.lstrip()
+            stripped = lstripped.rstrip()
+            # Only "... {" line endings and "} else" lines are rewritten below
+            if not stripped.endswith(" {") and not stripped.startswith("}"):
+                append(line)
+                continue
 
             # Skip comment lines entirely
-            if stripped.startswith("//") or stripped.startswith("/*"):
-                result.append(line)
-                i += 1
+            if stripped.startswith(("//", "/*")):
+                append(line)
                 continue
 
+            indent_str = " " * (len(line) - len(lstripped))
+
             # Check for } else or } else if patterns FIRST (before general { check)
             # This handles: } else {, } else if (x) {, } else, etc.
-            if re.match(r"^\}\s*(else|else\s+if)", stripped):
+            if stripped.startswith("}") and "else" in stripped:
                 # Split into } and else/else if parts
-                match = re.match(
-                    r"^(\})\s*(else\s+if\s*\(.*\)|else\s+if.*|else)\s*(\{)?$", stripped
-                )
+                match = ELSE_SPLIT_PATTERN.match(stripped)
                 if match:
-                    result.append(indent_str + "}")
+                    append(indent_str + "}")
                     else_part = match.group(2)
                     has_brace = match.group(3) == "{"
-                    result.append(indent_str + else_part)
+                    append(indent_str + else_part)
                     if has_brace:
-                        result.append(indent_str + "{")
-                else:
+                        append(indent_str + "{")
+                    continue
+                if ELSE_PATTERN.match(stripped):
                     # Fallback: append as-is if the detailed regex doesn't match.
                     # This can happen with unusual patterns like "} else // comment"
                     # or "} else if (complex && expression)" that span multiple lines.
                     # The initial check matched "} else" but the full pattern didn't.
-                    result.append(line)
-                i += 1
-                continue
+                    append(line)
+                    continue
 
             # Check for K&R style: something { at end of line (not just "{")
             if (
@@ -536,47 +580,31 @@ class CSharpFormatter:
                 and not stripped.endswith("= {")
             ):
                 # Skip inline initializers and collection expressions
-                skip_patterns = [
-                    " = new ",  # Object initializer: var x = new Foo {
-                    "=> {",  # Lambda with block body
-                    "= new(",  # Target-typed new
-                    "new[] {",  # Array initializer with elements
-                    "new {",  # Anonymous type
-                    "new() {",  # Target-typed new with initializer
-                    "with {",  # With expressions (C# 9+)
-                    "] {",  # After indexer
-                    "return new ",  # Return new object
-                ]
-                if any(pattern in stripped for pattern in skip_patterns):
-                    result.append(line)
-                    i += 1
+                if INLINE_BRACE_PATTERN.search(stripped):
+                    append(line)
                     continue
 
                 # Skip attribute syntax
                 if stripped.startswith("["):
-                    result.append(line)
-                    i += 1
+                    append(line)
                     continue
 
                 # Move brace to next line
                 content = stripped[:-2].rstrip()  # Remove " {"
                 if content:
-                    result.append(indent_str + content)
-                    result.append(indent_str + "{")
+                    append(indent_str + content)
+                    append(indent_str + "{")
                 else:
-                    result.append(line)
+                    append(line)
             else:
-                result.append(line)
+                append(line)
 
-            i += 1
+        return result
 
-        return "\n".join(result)
-
-    def _ensure_blank_lines_between_members(self, code: str) -> str:
+    def _ensure_blank_lines_between_members(self, lines: List[str]) -> List[str]:
         """Ensure blank lines between class members."""
-        lines = code.split("\n")
         if len(lines) < 3:
-            return code
+            return lines
 
         result = [lines[0]]
 
@@ -586,67 +614,180 @@ class CSharpFormatter:
 
             # Add blank line after } if next line is a member declaration
             if prev_line == "}" and curr_line:
-                member_keywords = [
-                    "public ",
-                    "private ",
-                    "protected ",
-                    "internal ",
-                    "static ",
-                    "void ",
-                    "async ",
-                ]
-                if any(curr_line.startswith(kw) for kw in member_keywords):
+                if curr_line.startswith(self.MEMBER_PREFIXES):
                     # Check if there's already a blank line
                     if result and result[-1].strip() != "":
                         result.append("")
 
             result.append(lines[i])
 
-        return "\n".join(result)
+        return result
+
 
+# Single alternation so each line is scanned once instead of once per keyword.
+# Built after the class body so the class stays compilable with mypyc.
+KEYWORD_PAREN_PATTERN = re.compile(
+    r"\b(" + "|".join(sorted(CSharpFormatter.KEYWORDS_WITH_SPACE)) + r")\("
+)
 
-def format_markdown_file(file: Path, dry_run: bool = False) -> Tuple[bool, int]:
+
+_shared_formatter: Optional[CSharpFormatter] = None
+
+
+def get_shared_formatter() -> CSharpFormatter:
+    """Return this process's formatter, so its block cache spans every file."""
+    global _shared_formatter
+    if _shared_formatter is None:
+        _shared_formatter = CSharpFormatter()
+    return _shared_formatter
+
+
+def format_markdown_file(
+    file: Path, dry_run: bool = False, formatter: Optional[CSharpFormatter] = None
+) -> Tuple[bool, int]:
     """Format all C# code blocks in a markdown file.
 
+    Uses the shared per-process formatter unless one is passed in, so snippets
+    repeated across files are only formatted once.
+
     Returns (was_modified, number_of_blocks_formatted).
     """
     content = file.read_text(encoding="utf-8")
-    original_content = content
-    blocks = extract_csharp_blocks(file)
+    if "```cs" not in content:
+        return False, 0
+
+    lines = content.split("\n")
+    blocks = extract_csharp_blocks(file, lines=lines)
 
     if not blocks:
         return False, 0
 
-    formatter = CSharpFormatter()
+    if formatter is None:
+        formatter = get_shared_formatter()
     formatted_count = 0
 
-    # Process blocks in reverse order to maintain line numbers
+    # Process blocks in reverse order to maintain line numbers, splicing into
+    # the one line list so the file is only joined once at the end
     for block in reversed(blocks):
         formatted = formatter.format_code(block.content)
 
         if formatted != block.content:
             formatted_count += 1
-
-            # Replace in content
-            lines = content.split("\n")
             # block.line_start is 1-indexed, points to the ```csharp line
             # block.line_end is 1-indexed, points to the closing ``` line
+            # Keep both fences and replace only the lines between them
+            lines[block.line_start : block.line_end - 1] = [formatted]
 
-            new_lines = (
-                lines[: block.line_start]  # Up to and including opening ```csharp
-                + [formatted]
-                + lines[block.line_end - 1 :]  # From closing ``` onwards
-            )
-            content = "\n".join(new_lines)
-
-    if content != original_content:
+    if formatted_count:
         if not dry_run:
-            file.write_text(content, encoding="utf-8")
+            file.write_text("\n".join(lines), encoding="utf-8")
         return True, formatted_count
 
     return False, formatted_count
 
 
+def _format_file(file: Path, dry_run: bool) -> FormatResult:
+    """Format a single file, capturing any exception in the result."""
+    try:
+        modified, count = format_markdown_file(file, dry_run=dry_run)
+    except Exception as e:
+        return FormatResult(
+            file=file,
+            error=f"{type(e).__name__}: {e}",
+            details=traceback.format_exc(),
+        )
+    return FormatResult(file=file, modified=modified, blocks_formatted=count)
+
+
+def iter_format_results(
+    files: Sequence[Path], dry_run: bool = False, jobs: int = 1
+) -> Iterator[FormatResult]:
+    """Format files, yielding results in input order.
+
+    With jobs > 1 the files are spread over a process pool; each file is
+    independent, so workers read, format and write their own files. Closing
+    the generator early cancels files not yet handed to a worker.
+    """
+    return map_in_pool(_format_file, files, repeat(dry_run), jobs=jobs)
+
+
+def content_digest(data: bytes) -> str:
+    """Hash file or script contents for the clean-file cache."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def load_clean_cache(cache_file: Path) -> Dict[str, str]:
+    """Load the path -> "size:mtime_ns:hash" map of files that needed no formatting.
+
+    The cache is tied to this script's own contents, so any change to the
+    formatting rules starts from an empty cache.
+    """
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("formatter") != _formatter_digest():
+        return {}
+    clean = data.get("clean")
+    return clean if isinstance(clean, dict) else {}
+
+
+def save_clean_cache(cache_file: Path, clean: Dict[str, str]) -> None:
+    """Write the clean-file cache, ignoring failures (it is only an optimization).
+
+    The cache is written to a temporary file and renamed into place, so an
+    interrupted or concurrent run never leaves a truncated cache behind.
+    """
+    data = {"formatter": _formatter_digest(), "clean": clean}
+    tmp_name = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_file.parent, delete=False
+        ) as tmp:
+            tmp_name = tmp.name
+            json.dump(data, tmp)
+        os.replace(tmp_name, cache_file)
+    except OSError:
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+
+
+def filter_clean_files(
+    files: Sequence[Path], clean_cache: Dict[str, str]
+) -> Tuple[List[Path], Dict[Path, str]]:
+    """Drop files the cache records as clean.
+
+    Returns the files still to format and the cache entry each would get if it
+    turns out clean. A file whose size and mtime match its entry is skipped
+    without being read; otherwise its contents are hashed and compared.
+    """
+    remaining: List[Path] = []
+    entries: Dict[Path, str] = {}
+    for file in files:
+        key = str(file.resolve())
+        cached = clean_cache.get(key, "")
+        try:
+            stat = file.stat()
+            signature = f"{stat.st_size}:{stat.st_mtime_ns}:"
+            if cached.startswith(signature):
+                continue
+            entry = signature + content_digest(file.read_bytes())
+        except OSError:
+            remaining.append(file)  # Let formatting report the error
+            continue
+        if cached.rpartition(":")[2] == entry.rpartition(":")[2]:
+            clean_cache[key] = entry  # Touched but unchanged
+            continue
+        entries[file] = entry
+        remaining.append(file)
+    return remaining, entries
+
+
+def _formatter_digest() -> str:
+    return content_digest(Path(__file__).read_bytes())
+
+
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Format C# code blocks in markdown files"
@@ -670,6 +811,25 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Exit with error on first failure instead of continuing",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Number of worker processes used to format files "
+        "(default: number of CPUs, or 1 with --strict; 1 disables the process pool)",
+    )
+    parser.add_argument(
+        "--cache-file",
+        type=Path,
+        default=DEFAULT_CACHE_FILE,
+        help="Where to remember files that needed no formatting "
+        f"(default: {DEFAULT_CACHE_FILE})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Format every file, ignoring and not updating the cache",
+    )
     return parser.parse_args(argv)
 
 
@@ -684,29 +844,53 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     for path_str in args.paths:
         path = Path(path_str)
         if path.is_file():
-            if path.suffix.lower() in {".md", ".markdown", ".mdx"}:
+            if path.suffix.lower() in MARKDOWN_SUFFIXES:
                 paths_to_process.append(path)
         elif path.is_dir():
-            paths_to_process.extend(path.rglob("*.md"))
-            paths_to_process.extend(path.rglob("*.markdown"))
-            paths_to_process.extend(path.rglob("*.mdx"))
+            # Single walk over the tree instead of one rglob per suffix
+            for root, _dirs, files in os.walk(path):
+                for name in files:
+                    if os.path.splitext(name)[1] in MARKDOWN_SUFFIXES:
+                        paths_to_process.append(Path(root) / name)
+
+    files_to_process = sorted(set(paths_to_process))
+
+    # Skip files whose contents match a previous run that found nothing to format
+    clean_cache: Dict[str, str] = {}
+    cache_entries: Dict[Path, str] = {}
+    if not args.no_cache:
+        clean_cache = load_clean_cache(args.cache_file)
+        files_to_process, cache_entries = filter_clean_files(
+            files_to_process, clean_cache
+        )
+
+    # Strict mode must not touch any file after the first failure, which only
+    # the serial path can promise: pool workers run ahead of the result stream
+    jobs = 1 if args.strict else args.jobs or os.cpu_count() or 1
+    for result in iter_format_results(files_to_process, args.dry_run, jobs):
+        if result.error is None and result.file in cache_entries:
+            key = str(result.file.resolve())
+            if result.modified:
+                clean_cache.pop(key, None)
+            else:
+                clean_cache[key] = cache_entries[result.file]
 
-    for file in sorted(set(paths_to_process)):
-        try:
-            modified, count = format_markdown_file(file, dry_run=args.dry_run)
-            if modified:
-                files_modified += 1
-                blocks_formatted += count
-                if args.verbose:
-                    action = "Would format" if args.dry_run else "Formatted"
-                    print(f"{action}: {file} ({count} blocks)")
-        except Exception as e:
+        if result.error is not None:
             errors_encountered += 1
-            print(f"Error processing {file}: {type(e).__name__}: {e}")
-            if args.verbose:
-                traceback.print_exc()
+            print(f"Error processing {result.file}: {result.error}")
+            if args.verbose and result.details:
+                print(result.details, end="", file=sys.stderr)
             if args.strict:
                 return 1
+        elif result.modified:
+            files_modified += 1
+            blocks_formatted += result.blocks_formatted
+            if args.verbose:
+                action = "Would format" if args.dry_run else "Formatted"
+                print(f"{action}: {result.file} ({result.blocks_formatted} blocks)")
+
+    if not args.no_cache:
+        save_clean_cache(args.cache_file, clean_cache)
 
     action = "Would modify" if args.dry_run else "Modified"
     print(f"\n{action} {files_modified} files ({blocks_formatted} code blocks)")
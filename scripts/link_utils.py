@@ -3,9 +3,22 @@
 from __future__ import annotations
 
 import re
-from bisect import bisect_right
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+from functools import lru_cache
+from itertools import accumulate
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 from urllib.parse import unquote
 
 # =============================================================================
@@ -23,6 +36,25 @@ MAX_DISPLAY_LINE_LENGTH = 60  # For verbose output of code block first lines
 MAX_LINK_TEXT_LENGTH = 40  # For truncating link text in warnings
 MAX_URL_LENGTH = 50  # For truncating URLs in warnings
 
+# Precompiled patterns shared by the scanners below
+URL_PATTERN = re.compile(
+    r"<(?P<autolink>https?://[^>\s]+)>|(?P<bare>https?://[^\s)<>\"']+)"
+)
+HTML_TAG_PATTERN = re.compile(r"<[a-zA-Z][^>]*>")
+FENCE_PATTERN = re.compile(r"^\s*(```+|~~~+)")
+BACKTICK_RUN_PATTERN = re.compile(r"`+")
+
+# Bracket scanners for find_closing, keyed by (opener, closer). Escaped
+# characters match as a pair so they never count toward nesting depth.
+_CLOSING_PATTERNS: Dict[Tuple[str, str], re.Pattern[str]] = {}
+
+# Below this many items, worker process startup outweighs parallel processing
+MIN_ITEMS_FOR_POOL = 4
+# Items handed to a worker per round trip, amortizing IPC for small files
+POOL_CHUNK_SIZE = 8
+
+T = TypeVar("T")
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -53,17 +85,31 @@ class InlineLink:
     segment: str
 
 
-def extract_links(text: str) -> List[LinkMatch]:
+def extract_links(
+    text: str,
+    *,
+    code_ranges: List[Tuple[int, int]] | None = None,
+    inline_code_ranges: List[Tuple[int, int]] | None = None,
+    html_tag_ranges: List[Tuple[int, int]] | None = None,
+) -> List[LinkMatch]:
+    """Extract inline links, autolinks and bare URLs outside code and HTML tags.
+
+    Callers that have already computed any of the skip ranges for the text can
+    pass them in to avoid scanning the document again.
+    """
     matches: List[LinkMatch] = []
-    code_ranges = find_code_fence_ranges(text)
-    inline_code_ranges = find_inline_code_ranges(text)
-    html_tag_ranges = find_html_tag_ranges(text)
+    if code_ranges is None:
+        code_ranges = find_code_fence_ranges(text)
+    if inline_code_ranges is None:
+        inline_code_ranges = find_inline_code_ranges(text)
+    if html_tag_ranges is None:
+        html_tag_ranges = find_html_tag_ranges(text)
     # Skip code blocks, inline code, and HTML tags when detecting links
-    skip_ranges = code_ranges + inline_code_ranges + html_tag_ranges
+    skip_ranges = RangeIndex(code_ranges + inline_code_ranges + html_tag_ranges)
     line_offsets = build_line_offsets(text)
 
     for inline in find_inline_links(text):
-        if in_ranges(inline.start, skip_ranges):
+        if skip_ranges.contains(inline.start):
             continue
         line, column = index_to_line_column(line_offsets, inline.start)
         matches.append(
@@ -81,39 +127,35 @@ def extract_links(text: str) -> List[LinkMatch]:
             )
         )
 
-    used_ranges = [(m.start, m.end) for m in matches]
+    used_ranges = RangeIndex((m.start, m.end) for m in matches)
 
-    for autolink_match in re.finditer(r"<(https?://[^>\s]+)>", text):
-        start, end = autolink_match.span()
-        if in_ranges(start, skip_ranges) or overlaps_any(start, end, used_ranges):
+    # Autolinks and bare URLs share a single scan; the named group that
+    # matched tells them apart.
+    for url_match in URL_PATTERN.finditer(text):
+        start, end = url_match.span()
+        if skip_ranges.contains(start) or used_ranges.overlaps(start, end):
             continue
-        href = autolink_match.group(1)
-        line, column = index_to_line_column(line_offsets, start)
-        matches.append(
-            LinkMatch(
-                kind="autolink",
-                start=start,
-                end=end,
-                text=href,
-                href=href,
-                line=line,
-                column=column,
-                segment=text[start:end],
+        autolink = url_match.group("autolink")
+        if autolink is not None:
+            line, column = index_to_line_column(line_offsets, start)
+            matches.append(
+                LinkMatch(
+                    kind="autolink",
+                    start=start,
+                    end=end,
+                    text=autolink,
+                    href=autolink,
+                    line=line,
+                    column=column,
+                    segment=text[start:end],
+                )
             )
-        )
-        used_ranges.append((start, end))
-
-    bare_pattern = re.compile(r'https?://[^\s)<>"\']+')
-    for bare in bare_pattern.finditer(text):
-        start, end = bare.span()
-        if in_ranges(start, skip_ranges) or overlaps_any(start, end, used_ranges):
+            used_ranges.add(start, end)
             continue
-        href = bare.group(0)
-        trailing = ""
-        while href and href[-1] in ".,;:!?":
-            trailing = href[-1] + trailing
-            href = href[:-1]
-            end -= 1
+        bare = url_match.group("bare")
+        href = bare.rstrip(".,;:!?")
+        trailing = bare[len(href) :]
+        end -= len(trailing)
         if not href:
             continue
         line, column = index_to_line_column(line_offsets, start)
@@ -130,7 +172,7 @@ def extract_links(text: str) -> List[LinkMatch]:
                 separator=trailing,
             )
         )
-        used_ranges.append((start, end))
+        used_ranges.add(start, end)
     return sorted(matches, key=lambda m: m.start)
 
 
@@ -138,10 +180,9 @@ def find_inline_links(text: str) -> Iterable[InlineLink]:
     idx = 0
     length = len(text)
     while idx < length:
-        char = text[idx]
-        if char != "[":
-            idx += 1
-            continue
+        idx = text.find("[", idx)
+        if idx == -1:
+            return
         if idx > 0 and text[idx - 1] == "!":
             idx += 1
             continue
@@ -181,20 +222,29 @@ def find_inline_links(text: str) -> Iterable[InlineLink]:
 
 
 def find_closing(text: str, start: int, opener: str, closer: str) -> int:
+    if text.startswith(opener, start):
+        # Fast path: most brackets close before any nesting or escaping.
+        close = text.find(closer, start + 1)
+        if close == -1:
+            return -1
+        if (
+            text.find(opener, start + 1, close) == -1
+            and text.find("\\", start + 1, close) == -1
+        ):
+            return close
+    pattern = _CLOSING_PATTERNS.get((opener, closer))
+    if pattern is None:
+        pattern = re.compile(r"\\.|[" + re.escape(opener + closer) + "]", re.DOTALL)
+        _CLOSING_PATTERNS[(opener, closer)] = pattern
     depth = 0
-    i = start
-    while i < len(text):
-        current = text[i]
-        if current == "\\":
-            i += 2
-            continue
+    for match in pattern.finditer(text, start):
+        current = match.group()
         if current == opener:
             depth += 1
         elif current == closer:
             depth -= 1
             if depth == 0:
-                return i
-        i += 1
+                return match.start()
     return -1
 
 
@@ -213,12 +263,7 @@ def extract_href(dest_content: str) -> str:
 
 
 def build_line_offsets(text: str) -> List[int]:
-    offsets = [0]
-    total = 0
-    for line in text.splitlines(keepends=True):
-        total += len(line)
-        offsets.append(total)
-    return offsets
+    return [0, *accumulate(map(len, text.splitlines(keepends=True)))]
 
 
 def index_to_line_column(offsets: Sequence[int], index: int) -> Tuple[int, int]:
@@ -236,28 +281,27 @@ def find_html_tag_ranges(text: str) -> List[Tuple[int, int]]:
     ranges: List[Tuple[int, int]] = []
     # Match HTML tags including their attributes
     # This handles <a href="...">...</a>, <img src="...">, etc.
-    tag_pattern = re.compile(r"<[a-zA-Z][^>]*>")
-    for match in tag_pattern.finditer(text):
+    for match in HTML_TAG_PATTERN.finditer(text):
         ranges.append((match.start(), match.end()))
     return ranges
 
 
 def find_code_fence_ranges(text: str) -> List[Tuple[int, int]]:
     ranges: List[Tuple[int, int]] = []
-    fence_pattern = re.compile(r"^\s*(```+|~~~+)")
     in_fence = False
-    fence_char = ""
+    close_prefix = ""
     fence_start = 0
     offset = 0
 
     for line in text.splitlines(keepends=True):
         if not in_fence:
-            if fence_pattern.match(line):
+            fence_match = FENCE_PATTERN.match(line)
+            if fence_match:
                 in_fence = True
-                fence_char = line.strip()[0]
+                close_prefix = fence_match.group(1)[0] * 3
                 fence_start = offset
         else:
-            if line.strip().startswith(fence_char * 3):
+            if line.lstrip().startswith(close_prefix):
                 ranges.append((fence_start, offset + len(line)))
                 in_fence = False
         offset += len(line)
@@ -268,51 +312,72 @@ def find_code_fence_ranges(text: str) -> List[Tuple[int, int]]:
 
 def find_inline_code_ranges(text: str) -> List[Tuple[int, int]]:
     ranges: List[Tuple[int, int]] = []
-    i = 0
-    length = len(text)
-    while i < length:
-        if text[i] != "`":
-            i += 1
-            continue
-        run = 1
-        while i + run < length and text[i + run] == "`":
-            run += 1
+    if "`" not in text:
+        return ranges
+    runs = [match.span() for match in BACKTICK_RUN_PATTERN.finditer(text)]
+    # Run indices grouped by length, so an opener can bisect straight to the
+    # next run that could close it instead of rescanning the text.
+    closers: Dict[int, List[int]] = {1: [], 2: []}
+    for index, (start, end) in enumerate(runs):
+        if end - start < 3:
+            closers[end - start].append(index)
+    index = 0
+    while index < len(runs):
+        start, end = runs[index]
+        run = end - start
         # Treat runs of three or more as potential fences handled elsewhere.
         if run >= 3:
-            i += run
+            index += 1
             continue
-        j = i + run
-        while j < length:
-            if text[j] != "`":
-                j += 1
-                continue
-            close_run = 1
-            while j + close_run < length and text[j + close_run] == "`":
-                close_run += 1
-            if close_run == run:
-                ranges.append((i, j + close_run))
-                i = j + close_run
-                break
-            j += close_run
-        else:
-            i += run
+        candidates = closers[run]
+        position = bisect_right(candidates, index)
+        if position == len(candidates):
+            index += 1
+            continue
+        closing = candidates[position]
+        ranges.append((start, runs[closing][1]))
+        index = closing + 1
     return ranges
 
 
-def in_ranges(index: int, ranges: Iterable[Tuple[int, int]]) -> bool:
-    for start, end in ranges:
-        if start <= index < end:
-            return True
-    return False
+class RangeIndex:
+    """Sorted, coalesced set of half-open ranges with O(log n) lookups.
+
+    Overlapping or touching ranges are merged on construction, so membership
+    and overlap tests reduce to a single bisect instead of a linear scan.
+    """
 
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, ranges: Iterable[Tuple[int, int]] = ()) -> None:
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        for start, end in sorted(ranges):
+            if start >= end:
+                continue
+            if self.ends and start <= self.ends[-1]:
+                if end > self.ends[-1]:
+                    self.ends[-1] = end
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
 
-def overlaps_any(start: int, end: int, ranges: Iterable[Tuple[int, int]]) -> bool:
-    for r_start, r_end in ranges:
-        if start < r_end and end > r_start:
-            return True
-    return False
+    def contains(self, index: int) -> bool:
+        i = bisect_right(self.starts, index) - 1
+        return i >= 0 and index < self.ends[i]
 
+    def overlaps(self, start: int, end: int) -> bool:
+        i = bisect_right(self.ends, start)
+        return i < len(self.starts) and self.starts[i] < end
 
+    def add(self, start: int, end: int) -> None:
+        """Insert a range; callers must ensure it overlaps no existing range."""
+        i = bisect_left(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+
+
+@lru_cache(maxsize=1024)
 def split_anchor(href: str) -> Tuple[str, str | None]:
     """Split a URL into path and anchor parts, URL-decoding both.
 
@@ -327,3 +392,28 @@ def split_anchor(href: str) -> Tuple[str, str | None]:
         return unquote(href), None
     path, anchor = href.split("#", 1)
     return unquote(path), unquote(anchor)
+
+
+# =============================================================================
+# Process Pools
+# =============================================================================
+
+
+def map_in_pool(
+    func: Callable[..., T], items: Sequence[Any], *args: Iterable[Any], jobs: int
+) -> Iterator[T]:
+    """Map func over items (and any extra argument iterables) in input order.
+
+    With jobs > 1 and enough items the calls are spread over a process pool;
+    otherwise they run in-process. Closing the iterator early cancels calls
+    not yet handed to a worker.
+    """
+    if jobs <= 1 or len(items) < MIN_ITEMS_FOR_POOL:
+        yield from map(func, items, *args)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        yield from executor.map(func, items, *args, chunksize=POOL_CHUNK_SIZE)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
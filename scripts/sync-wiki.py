@@ -11,17 +11,20 @@ This script:
 
 from __future__ import annotations
 
+import os
 import re
 import shutil
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, repeat
 from pathlib import Path, PurePosixPath
 
 # Import shared link utilities for proper code block handling
 from link_utils import (
     CRITICAL_PAGES,
     extract_links,
-    find_code_fence_ranges,
-    find_inline_code_ranges,
-    in_ranges,
+    map_in_pool,
     split_anchor,
 )
 
@@ -120,10 +123,23 @@ ROOT_WIKI_NAMES = {
     "CHANGELOG": "Changelog",
 }
 
+# Markdown emphasis markers stripped from wiki link display text
+BOLD_ASTERISK_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+BOLD_UNDERSCORE_PATTERN = re.compile(r"__(.+?)__")
+ITALIC_ASTERISK_PATTERN = re.compile(r"\*(.+?)\*")
+ITALIC_UNDERSCORE_PATTERN = re.compile(r"(?<!\w)_(.+?)_(?!\w)")
+
+# Leading whitespace then "|", the start of a Markdown table row
+TABLE_ROW_PATTERN = re.compile(r"\s*\|")
+
+# Thread count for reading sources and writing pages concurrently (I/O bound)
+IO_WORKERS = 8
+
 # Track warnings for unmapped links
 _unmapped_links: list[tuple[str, str, str]] = []
 
 
+@lru_cache(maxsize=1024)
 def normalize_path(path: str) -> str:
     """Normalize a path to use forward slashes (POSIX style) for consistent matching."""
     return str(PurePosixPath(Path(path)))
@@ -134,37 +150,101 @@ def remove_md_suffix(path: str) -> str:
     return path.removesuffix(".md")
 
 
+def _split_posix_path(path: str) -> tuple[str, list[str]]:
+    """Split a POSIX path into its root ("", "/" or "//") and its segments.
+
+    Empty and "." segments are dropped, matching PurePosixPath.parts.
+    """
+    if not path.startswith("/"):
+        root = ""
+    elif path.startswith("//") and not path.startswith("///"):
+        root = "//"
+    else:
+        root = "/"
+    return root, [segment for segment in path.split("/") if segment not in ("", ".")]
+
+
+def _is_plain_relative_path(path: str) -> bool:
+    """Check whether a relative path has no empty, "." or ".." segments."""
+    return bool(path) and not (
+        path.startswith((".", "/"))
+        or path.endswith("/")
+        or "/." in path
+        or "//" in path
+    )
+
+
 def resolve_relative_path(source_file: str, link: str) -> str | None:
     """
     Resolve a relative link path from a source file location.
 
     Returns None if the path escapes the documentation root (too many ..).
     """
-    source_dir = PurePosixPath(source_file).parent
-    if str(source_dir) == ".":
-        resolved = PurePosixPath(link)
+    # Fast path: a plain "dir/page.md" link from a plain source path has
+    # nothing to normalize, so it can simply be appended to the source
+    # directory.
+    if _is_plain_relative_path(link) and _is_plain_relative_path(source_file):
+        source_dir, _, _ = source_file.rpartition("/")
+        return f"{source_dir}/{link}" if source_dir else link
+
+    # Plain string splitting keeps this off the pathlib machinery; it
+    # follows PurePosixPath semantics, including absolute links replacing
+    # the source directory.
+    link_root, link_segments = _split_posix_path(link)
+    if link_root:
+        segments = [link_root, *link_segments]
     else:
-        resolved = source_dir / link
+        source_root, source_segments = _split_posix_path(source_file)
+        segments = source_segments[:-1] + link_segments
+        if source_root:
+            segments.insert(0, source_root)
 
-    # Normalize to handle .. and .
+    # Normalize to handle ..
     parts: list[str] = []
-    escape_count = 0
 
-    for part in resolved.parts:
+    for part in segments:
         if part == "..":
-            if parts:
-                parts.pop()
-            else:
+            if not parts:
                 # Trying to escape root
-                escape_count += 1
-        elif part != ".":
+                return None
+            parts.pop()
+        else:
             parts.append(part)
 
-    # If we ever tried to escape the root, the path is invalid
-    if escape_count > 0:
+    if not parts:
+        return "."
+    if parts[0] in ("/", "//"):
+        return parts[0] + "/".join(parts[1:])
+    return "/".join(parts)
+
+
+@lru_cache(maxsize=4096)
+def resolve_wiki_key(source_file: str, link_path: str) -> str | None:
+    """Resolve a link path to the docs-relative, suffix-less key of its target.
+
+    Many pages link to the same targets, so results are cached per
+    (source_file, link_path) pair.
+
+    Returns None if the path escapes the documentation root.
+    """
+    # Resolve relative path using POSIX-style paths
+    resolved = resolve_relative_path(normalize_path(source_file), link_path)
+    if resolved is None:
         return None
 
-    return str(PurePosixPath(*parts)) if parts else "."
+    # Remove .md extension for matching
+    resolved_without_ext = remove_md_suffix(resolved)
+
+    # Strip docs/ prefix if present (for links from root files like README.md)
+    # WIKI_STRUCTURE uses paths relative to docs/, not the repo root
+    if resolved_without_ext.startswith("docs/"):
+        resolved_without_ext = resolved_without_ext[5:]  # Remove "docs/" prefix
+
+    # Handle trailing slashes (e.g., "./directory/" -> "directory/README")
+    if resolved_without_ext.endswith("/"):
+        resolved_without_ext = resolved_without_ext.rstrip("/") + "/README"
+
+    return resolved_without_ext
 
 
 def strip_markdown_formatting(text: str) -> str:
@@ -181,42 +261,72 @@ def strip_markdown_formatting(text: str) -> str:
         "**bold** and *italic*" -> "bold and italic"
         "snake_case_var" -> "snake_case_var"  (preserved)
     """
+    # Most link text has no emphasis at all; return it untouched, and skip
+    # each regex pass below whenever its marker cannot match
+    if "*" not in text and "_" not in text:
+        return text
+
     # Remove bold: **text** or __text__
-    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
-    text = re.sub(r"__(.+?)__", r"\1", text)
+    if "**" in text:
+        text = BOLD_ASTERISK_PATTERN.sub(r"\1", text)
+    if "__" in text:
+        text = BOLD_UNDERSCORE_PATTERN.sub(r"\1", text)
     # Remove italic: *text* or _text_ (but not inside words like snake_case)
     # Only match _ at word boundaries to avoid breaking snake_case
-    text = re.sub(r"\*(.+?)\*", r"\1", text)
-    text = re.sub(r"(?<!\w)_(.+?)_(?!\w)", r"\1", text)
+    if "*" in text:
+        text = ITALIC_ASTERISK_PATTERN.sub(r"\1", text)
+    if "_" in text:
+        text = ITALIC_UNDERSCORE_PATTERN.sub(r"\1", text)
     return text
 
 
-def is_in_table_row(content: str, position: int) -> bool:
+def build_line_starts(content: str) -> list[int]:
+    """Return the offset of every line start, plus a sentinel past the end.
+
+    Lines are split on newlines only, matching how is_in_table_row finds
+    line boundaries.
+    """
+    return [0, *accumulate(len(line) + 1 for line in content.split("\n"))]
+
+
+def is_in_table_row(
+    content: str, position: int, line_starts: list[int] | None = None
+) -> bool:
     """Check if a position in the content is inside a Markdown table row.
 
     A table row starts with | and contains | as column separators.
     We detect this by finding the start of the current line and checking
-    if it begins with |.
+    if it begins with |. Callers testing many positions in one document can
+    pass the result of build_line_starts to locate lines by bisection.
 
     Note: Separator rows (e.g., | --- | --- |) are excluded from detection
     since they don't contain content that needs link conversion. Per the
     GitHub Flavored Markdown specification (section 4.10), a valid separator
     row requires each cell to contain at least 3 consecutive dashes.
     """
-    # Find the start of the line containing this position
-    line_start = content.rfind("\n", 0, position) + 1
+    if line_starts is not None:
+        line_index = bisect_right(line_starts, position) - 1
+        line_start = line_starts[line_index]
+        line_end = line_starts[line_index + 1] - 1
+    else:
+        # Find the start of the line containing this position
+        line_start = content.rfind("\n", 0, position) + 1
 
-    # Find the end of the line
-    line_end = content.find("\n", position)
-    if line_end == -1:
-        line_end = len(content)
+        # Find the end of the line
+        line_end = content.find("\n", position)
+        if line_end == -1:
+            line_end = len(content)
 
-    line = content[line_start:line_end]
+    return _is_table_row_line(content[line_start:line_end])
 
-    # A table row starts with | (possibly with leading whitespace)
-    stripped = line.strip()
-    if not stripped.startswith("|"):
+
+def _is_table_row_line(line: str) -> bool:
+    """Check if a single line is a Markdown table row other than a separator."""
+    # A table row starts with | (possibly with leading whitespace); matching
+    # the prefix rejects other lines without copying them
+    if not TABLE_ROW_PATTERN.match(line):
         return False
+    stripped = line.strip()
 
     # Check it's not a separator row like | --- | --- |
     # Per GFM spec, each cell must have at least 3 consecutive dashes
@@ -248,55 +358,64 @@ def _is_separator_row(line: str) -> bool:
     """
     # Split by | and check each cell
     # First and last elements may be empty due to leading/trailing |
-    cells = line.split("|")
-
     # Filter out empty cells from leading/trailing pipes
-    cells = [cell.strip() for cell in cells if cell.strip()]
+    cells = [cell for cell in map(str.strip, line.split("|")) if cell]
 
     if not cells:
         return False
 
     # Each cell must contain only dashes, colons, and spaces
     # AND each cell must have at least 3 consecutive dashes (GFM requirement)
-    separator_chars = set("-: ")
-    for cell in cells:
-        # Check cell contains only valid separator characters
-        if not all(c in separator_chars for c in cell):
-            return False
-
-        # Check cell has at least 3 consecutive dashes
-        max_consecutive_dashes = 0
-        current_dash_count = 0
-        for c in cell:
-            if c == "-":
-                current_dash_count += 1
-                max_consecutive_dashes = max(max_consecutive_dashes, current_dash_count)
-            else:
-                current_dash_count = 0
+    # Both checks are single C-level string scans per cell
+    return all(not cell.strip("-: ") and "---" in cell for cell in cells)
 
-        if max_consecutive_dashes < 3:
-            return False
 
-    return True
+def build_page_lookup() -> dict[str, str]:
+    """Map suffix-less source paths to wiki page names, root files included.
 
+    WIKI_STRUCTURE entries take precedence over ROOT_WIKI_NAMES. The result
+    reflects WIKI_STRUCTURE as it is now, so callers converting a batch of
+    documents should build it once and pass it to each convert_links call.
+    """
+    return {
+        **ROOT_WIKI_NAMES,
+        **{
+            remove_md_suffix(src_path): name
+            for src_path, name in WIKI_STRUCTURE.items()
+        },
+    }
 
-def convert_links(content: str, source_file: str) -> str:
-    """Convert relative markdown links to wiki links, skipping code blocks."""
-    # Get code ranges to skip
-    code_ranges = find_code_fence_ranges(content)
-    inline_code_ranges = find_inline_code_ranges(content)
-    skip_ranges = code_ranges + inline_code_ranges
 
-    # Use link_utils to extract links properly (handles nested brackets, escaping, etc.)
-    links = extract_links(content)
+def convert_links(
+    content: str, source_file: str, page_lookup: dict[str, str] | None = None
+) -> str:
+    """Convert relative markdown links to wiki links, skipping code blocks.
 
-    # Process links in reverse order to maintain correct positions during replacement
-    result = content
-    for link_match in reversed(links):
-        # Skip links inside code blocks
-        if in_ranges(link_match.start, skip_ranges):
-            continue
+    page_lookup is the result of build_page_lookup; it is built on demand
+    when omitted.
+    """
+    # Every convertible link is "[text](target)"; without both brackets there
+    # is nothing to convert and the link scan can be skipped. A plain "]("
+    # check would miss links written with whitespace before the parenthesis.
+    if "[" not in content or "(" not in content:
+        return content
 
+    # Use link_utils to extract links properly (handles nested brackets, escaping, etc.)
+    # It already drops links that start inside code fences or inline code.
+    links = extract_links(content)
+    line_starts = build_line_starts(content)
+    # Table-row classification per line index, so several links on one table
+    # row only classify it once
+    table_rows: dict[int, bool] = {}
+
+    if page_lookup is None:
+        page_lookup = build_page_lookup()
+
+    # Links come back sorted and non-overlapping, so walk them in order and
+    # stitch the unchanged text between replacements together at the end
+    pieces: list[str] = []
+    cursor = 0
+    for link_match in links:
         # Only process inline links (not autolinks or bare URLs)
         if link_match.kind != "inline":
             continue
@@ -318,40 +437,18 @@ def convert_links(content: str, source_file: str) -> str:
         if not link_path:
             continue
 
-        # Resolve relative path using POSIX-style paths
-        resolved = resolve_relative_path(normalize_path(source_file), link_path)
+        # Resolve relative path to the key used for wiki page lookups
+        resolved_without_ext = resolve_wiki_key(source_file, link_path)
 
         # Handle invalid paths (escaping root)
-        if resolved is None:
+        if resolved_without_ext is None:
             _unmapped_links.append(
                 (source_file, href, "path escapes documentation root")
             )
             continue
 
-        # Remove .md extension for matching
-        resolved_without_ext = remove_md_suffix(resolved)
-
-        # Strip docs/ prefix if present (for links from root files like README.md)
-        # WIKI_STRUCTURE uses paths relative to docs/, not the repo root
-        if resolved_without_ext.startswith("docs/"):
-            resolved_without_ext = resolved_without_ext[5:]  # Remove "docs/" prefix
-
-        # Handle trailing slashes (e.g., "./directory/" -> "directory/README")
-        if resolved_without_ext.endswith("/"):
-            resolved_without_ext = resolved_without_ext.rstrip("/") + "/README"
-
-        # Look up wiki page name with exact matching
-        wiki_name = None
-        for src_path, name in WIKI_STRUCTURE.items():
-            src_without_ext = remove_md_suffix(src_path)
-            # Exact match only - no endswith to avoid false positives
-            if resolved_without_ext == src_without_ext:
-                wiki_name = name
-                break
-
-        # Handle root files
-        if wiki_name is None and resolved_without_ext in ROOT_WIKI_NAMES:
-            wiki_name = ROOT_WIKI_NAMES[resolved_without_ext]
+        # Look up wiki page name (docs pages or root files) with exact matching
+        wiki_name = page_lookup.get(resolved_without_ext)
 
         if wiki_name is not None:
             # Use wiki page name as fallback if link text is empty
@@ -363,9 +460,13 @@ def convert_links(content: str, source_file: str) -> str:
             # Check if this link is inside a table row
             # If so, we need to escape the pipe character to prevent it from
             # being interpreted as a table column separator
-            # Note: Use original content for position check since link_match.start
-            # refers to positions in the original content, not the modified result
-            in_table = is_in_table_row(content, link_match.start)
+            line_index = bisect_right(line_starts, link_match.start) - 1
+            in_table = table_rows.get(line_index)
+            if in_table is None:
+                line = content[
+                    line_starts[line_index] : line_starts[line_index + 1] - 1
+                ]
+                in_table = table_rows[line_index] = _is_table_row_line(line)
 
             if in_table:
                 # In tables, use escaped pipe: [[Display\|Page]]
@@ -384,12 +485,17 @@ def convert_links(content: str, source_file: str) -> str:
                 new_link = f"[[{wiki_name}{anchor}]]"
             else:
                 new_link = f"[[{display_text}{separator}{wiki_name}{anchor}]]"
-            result = result[: link_match.start] + new_link + result[link_match.end :]
+            pieces.append(content[cursor : link_match.start])
+            pieces.append(new_link)
+            cursor = link_match.end
         else:
             # Track unmapped internal links for warning
             _unmapped_links.append((source_file, href, "no mapping found"))
 
-    return result
+    if not pieces:
+        return content
+    pieces.append(content[cursor:])
+    return "".join(pieces)
 
 
 def read_file_safe(path: Path) -> str | None:
@@ -405,46 +511,92 @@ def read_file_safe(path: Path) -> str | None:
 
 
 def write_file_safe(path: Path, content: str) -> bool:
-    """Safely write a file, returning False on error."""
+    """Safely write a file, returning False on error.
+
+    A file whose current content already matches is left untouched, so
+    unchanged pages keep their timestamps. The content is encoded once and
+    written as-is, so newlines stay LF on every platform.
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return True
+    except OSError:
+        pass
     try:
-        path.write_text(content, encoding="utf-8")
+        path.write_bytes(data)
         return True
     except OSError as e:
         print(f"  Error writing {path}: {e}")
         return False
 
 
-def process_file(src_path: Path, wiki_name: str) -> bool:
-    """Process a markdown file and copy to wiki directory."""
-    content = read_file_safe(src_path)
-    if content is None:
-        return False
+def read_files_parallel(paths: list[Path]) -> dict[Path, str | None]:
+    """Read files concurrently, mapping each path to its content (None on error)."""
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+        return dict(zip(paths, executor.map(read_file_safe, paths)))
 
-    # Convert links using normalized path
-    try:
-        relative_path = str(src_path.relative_to(DOCS_DIR))
-    except ValueError:
-        relative_path = str(src_path)
-
-    # Normalize to forward slashes for consistent link resolution
-    relative_path = normalize_path(relative_path)
-    content = convert_links(content, relative_path)
-
-    # Write to wiki
-    dest_path = WIKI_DIR / f"{wiki_name}.md"
-    if write_file_safe(dest_path, content):
-        print(f"  {src_path} -> {dest_path}")
-        return True
-    return False
 
+def write_files_parallel(files: dict[Path, str]) -> dict[Path, bool]:
+    """Write files concurrently, mapping each path to whether it was written."""
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+        return dict(zip(files, executor.map(write_file_safe, files, files.values())))
 
-def generate_sidebar() -> str:
-    """Generate the wiki sidebar navigation.
 
-    Note: GitHub Wiki link format is [[DisplayText|PageName]], which is
-    the opposite of MediaWiki's [[PageName|DisplayText]] format.
+def convert_source(
+    src_path: Path, content: str, page_lookup: dict[str, str] | None = None
+) -> str:
+    """Convert the links in a source file's content to wiki format."""
+    # Convert links using the docs-relative path, with forward slashes for
+    # consistent link resolution
+    if src_path.is_relative_to(DOCS_DIR):
+        relative_path = src_path.relative_to(DOCS_DIR).as_posix()
+    else:
+        relative_path = src_path.as_posix()
+    return convert_links(content, relative_path, page_lookup)
+
+
+def _convert_source_collecting(
+    src_path: Path, content: str, page_lookup: dict[str, str]
+) -> tuple[str, list[tuple[str, str, str]]]:
+    """Convert a source and hand back the unmapped links it recorded.
+
+    Worker processes cannot append to the parent's _unmapped_links, so the
+    entries are detached here and merged back by convert_sources.
+    """
+    start = len(_unmapped_links)
+    converted = convert_source(src_path, content, page_lookup)
+    unmapped = _unmapped_links[start:]
+    del _unmapped_links[start:]
+    return converted, unmapped
+
+
+def convert_sources(sources: dict[Path, str]) -> dict[Path, str]:
+    """Convert many sources, fanning out across processes when cores allow.
+
+    Unmapped links are merged into _unmapped_links in source order, exactly
+    as a sequential run would record them.
     """
-    return """# Unity Tips & Tools
+    paths = list(sources)
+    contents = list(sources.values())
+    page_lookup = build_page_lookup()
+    results = map_in_pool(
+        _convert_source_collecting,
+        paths,
+        contents,
+        repeat(page_lookup),
+        jobs=os.cpu_count() or 1,
+    )
+
+    converted: dict[Path, str] = {}
+    for path, (content, unmapped) in zip(paths, results):
+        converted[path] = content
+        _unmapped_links.extend(unmapped)
+    return converted
+
+
+# Sidebar navigation written to _Sidebar.md
+_SIDEBAR = """# Unity Tips & Tools
 
 **[[Home]]**
 
@@ -505,14 +657,17 @@ def generate_sidebar() -> str:
 """
 
 
-def generate_home() -> str:
-    """Generate the Home.md landing page."""
-    readme_path = Path("README.md")
-    content = read_file_safe(readme_path)
-    if content is not None:
-        return convert_links(content, "README.md")
+def generate_sidebar() -> str:
+    """Generate the wiki sidebar navigation.
+
+    Note: GitHub Wiki link format is [[DisplayText|PageName]], which is
+    the opposite of MediaWiki's [[PageName|DisplayText]] format.
+    """
+    return _SIDEBAR
 
-    return """# Unity Tips & Tools
+
+# Landing page used when README.md cannot be read
+_HOME_FALLBACK = """# Unity Tips & Tools
 
 > Battle-tested practices and tools to build better Unity games faster.
 
@@ -534,16 +689,45 @@ For the best reading experience with search and navigation, visit the
 """
 
 
-def validate_wiki_structure() -> list[str]:
+def generate_home() -> str:
+    """Generate the Home.md landing page."""
+    readme_path = Path("README.md")
+    content = read_file_safe(readme_path)
+    if content is not None:
+        return convert_links(content, "README.md")
+
+    return _HOME_FALLBACK
+
+
+def list_doc_sources() -> set[str]:
+    """Return the paths of all markdown files under DOCS_DIR.
+
+    Paths are POSIX-style and relative to DOCS_DIR, matching WIKI_STRUCTURE
+    keys. A single directory walk replaces a stat per mapped file.
+    """
+    sources: set[str] = set()
+    for dirpath, _dirnames, filenames in os.walk(DOCS_DIR):
+        relative_dir = Path(dirpath).relative_to(DOCS_DIR).as_posix()
+        prefix = "" if relative_dir == "." else f"{relative_dir}/"
+        sources.update(prefix + name for name in filenames if name.endswith(".md"))
+    return sources
+
+
+def validate_wiki_structure(doc_sources: set[str] | None = None) -> list[str]:
     """Validate that all source files in WIKI_STRUCTURE exist.
 
+    Args:
+        doc_sources: Result of list_doc_sources, walked afresh when omitted.
+
     Returns:
         List of error messages for missing source files.
     """
+    if doc_sources is None:
+        doc_sources = list_doc_sources()
     errors = []
     for src_rel, wiki_name in WIKI_STRUCTURE.items():
-        src_path = DOCS_DIR / src_rel
-        if not src_path.exists():
+        if src_rel not in doc_sources:
+            src_path = DOCS_DIR / src_rel
             errors.append(f"Missing source file: {src_path} (mapped to {wiki_name})")
     return errors
 
@@ -558,7 +742,8 @@ def main() -> int:
 
     # Pre-validate WIKI_STRUCTURE
     print("\nValidating WIKI_STRUCTURE mappings...")
-    structure_errors = validate_wiki_structure()
+    existing_docs = list_doc_sources()
+    structure_errors = validate_wiki_structure(existing_docs)
     if structure_errors:
         print("  ERRORS found in WIKI_STRUCTURE:")
         for err in structure_errors:
@@ -570,38 +755,75 @@ def main() -> int:
     # Ensure wiki directory exists
     WIKI_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Clean wiki directory (except .git)
-    for item in WIKI_DIR.iterdir():
-        if item.name != ".git":
+    doc_sources = [
+        (DOCS_DIR / src_rel, wiki_name) for src_rel, wiki_name in WIKI_STRUCTURE.items()
+    ]
+    root_mapping = {
+        "CONTRIBUTING.md": "Contributing",
+        "CHANGELOG.md": "Changelog",
+    }
+    root_sources = [
+        (Path(filename), wiki_name) for filename, wiki_name in root_mapping.items()
+    ]
+
+    # Read every existing source up front, then convert them all in one batch
+    contents = read_files_parallel(
+        [DOCS_DIR / src_rel for src_rel in WIKI_STRUCTURE if src_rel in existing_docs]
+        + [src_path for src_path, _ in root_sources if src_path.exists()]
+    )
+    converted = convert_sources(
+        {src_path: text for src_path, text in contents.items() if text is not None}
+    )
+
+    # Write every converted page concurrently; results are reported below in
+    # source order
+    dest_paths = {
+        src_path: WIKI_DIR / f"{wiki_name}.md"
+        for src_path, wiki_name in doc_sources + root_sources
+        if src_path in converted
+    }
+
+    # Clean wiki directory (except .git), keeping pages that are about to be
+    # regenerated so unchanged ones are not rewritten
+    keep = {"Home.md", "_Sidebar.md"}
+    keep.update(dest.name for dest in dest_paths.values())
+    # scandir reports entry types from the directory listing, so this needs no
+    # stat per entry
+    with os.scandir(WIKI_DIR) as entries:
+        for item in entries:
+            if item.name == ".git":
+                continue
             try:
-                if item.is_dir():
-                    shutil.rmtree(item)
-                else:
-                    item.unlink()
+                if item.is_dir(follow_symlinks=False):
+                    shutil.rmtree(item.path)
+                elif item.name not in keep:
+                    os.unlink(item.path)
             except OSError as e:
-                print(f"  Warning: Could not remove {item}: {e}")
-
-    # Process all mapped files
-    print("\nProcessing documentation files:")
-    for src_rel, wiki_name in WIKI_STRUCTURE.items():
-        src_path = DOCS_DIR / src_rel
-        if src_path.exists():
-            if not process_file(src_path, wiki_name):
+                print(f"  Warning: Could not remove {item.path}: {e}")
+
+    written = write_files_parallel(
+        {dest_paths[src_path]: content for src_path, content in converted.items()}
+    )
+
+    # Report the per-file results in one write rather than a print per file
+    report = ["\nProcessing documentation files:"]
+    for src_path, wiki_name in doc_sources:
+        if src_path in contents:
+            if src_path in dest_paths and written[dest_paths[src_path]]:
+                report.append(f"  {src_path} -> {dest_paths[src_path]}")
+            else:
                 errors += 1
         else:
-            print(f"  ❌ MISSING: {src_path} (would generate {wiki_name}.md)")
+            report.append(f"  ❌ MISSING: {src_path} (would generate {wiki_name}.md)")
 
-    # Process root files
-    print("\nProcessing root files:")
-    root_mapping = {
-        "CONTRIBUTING.md": "Contributing",
-        "CHANGELOG.md": "Changelog",
-    }
-    for filename, wiki_name in root_mapping.items():
-        src_path = Path(filename)
-        if src_path.exists():
-            if not process_file(src_path, wiki_name):
+    report.append("\nProcessing root files:")
+    for src_path, _wiki_name in root_sources:
+        if src_path in contents:
+            if src_path in dest_paths and written[dest_paths[src_path]]:
+                report.append(f"  {src_path} -> {dest_paths[src_path]}")
+            else:
                 errors += 1
+    print("\n".join(report))
 
     # Generate Home page
     print("\nGenerating Home page...")
@@ -618,8 +840,12 @@ def main() -> int:
     # Report unmapped links
     if _unmapped_links:
         print(f"\nWarning: {len(_unmapped_links)} unmapped link(s) found:")
-        for source, link, reason in _unmapped_links:
-            print(f"  {source}: [{link}] - {reason}")
+        print(
+            "\n".join(
+                f"  {source}: [{link}] - {reason}"
+                for source, link, reason in _unmapped_links
+            )
+        )
         print(
             "  These links will not work in the wiki and may need to be added to WIKI_STRUCTURE."
         )
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Tests for format_csharp_blocks.py functionality."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import format_csharp_blocks
+from format_csharp_blocks import filter_clean_files, save_clean_cache
+
+
+def _entry(file: Path) -> str:
+    """Build the cache entry a clean file gets after formatting."""
+    stat = file.stat()
+    digest = format_csharp_blocks.content_digest(file.read_bytes())
+    return f"{stat.st_size}:{stat.st_mtime_ns}:{digest}"
+
+
+class TestFilterCleanFiles:
+    """Tests for skipping files the cache records as clean."""
+
+    def test_uncached_file_is_kept_with_pending_entry(self, tmp_path: Path) -> None:
+        file = tmp_path / "a.md"
+        file.write_text("# A\n", encoding="utf-8")
+
+        remaining, entries = filter_clean_files([file], {})
+
+        assert remaining == [file]
+        assert entries == {file: _entry(file)}
+
+    def test_matching_size_and_mtime_skips_without_reading(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        file = tmp_path / "a.md"
+        file.write_text("# A\n", encoding="utf-8")
+        cache = {str(file.resolve()): _entry(file)}
+
+        def fail_read(self: Path) -> bytes:
+            raise AssertionError(f"{self} should not be read")
+
+        monkeypatch.setattr(Path, "read_bytes", fail_read)
+        remaining, entries = filter_clean_files([file], cache)
+
+        assert remaining == []
+        assert entries == {}
+
+    def test_touched_but_unchanged_file_refreshes_entry(self, tmp_path: Path) -> None:
+        file = tmp_path / "a.md"
+        file.write_text("# A\n", encoding="utf-8")
+        key = str(file.resolve())
+        cache = {key: _entry(file)}
+        stat = file.stat()
+        os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        remaining, entries = filter_clean_files([file], cache)
+
+        assert remaining == []
+        assert entries == {}
+        assert cache[key] == _entry(file)
+
+    def test_modified_file_is_kept_for_formatting(self, tmp_path: Path) -> None:
+        file = tmp_path / "a.md"
+        file.write_text("# A\n", encoding="utf-8")
+        key = str(file.resolve())
+        stale = _entry(file)
+        cache = {key: stale}
+        file.write_text("# A, edited\n", encoding="utf-8")
+
+        remaining, entries = filter_clean_files([file], cache)
+
+        assert remaining == [file]
+        assert entries == {file: _entry(file)}
+        assert cache[key] == stale
+
+    def test_missing_file_is_left_for_formatting_to_report(
+        self, tmp_path: Path
+    ) -> None:
+        file = tmp_path / "missing.md"
+
+        remaining, entries = filter_clean_files([file], {})
+
+        assert remaining == [file]
+        assert entries == {}
+
+
+class TestCleanCacheFile:
+    """Tests for persisting the clean-file cache."""
+
+    def test_save_creates_parent_and_round_trips(self, tmp_path: Path) -> None:
+        cache_file = tmp_path / "nested" / "cache.json"
+        clean = {"/docs/a.md": "4:1:abc"}
+
+        save_clean_cache(cache_file, clean)
+
+        assert format_csharp_blocks.load_clean_cache(cache_file) == clean
+        assert [p.name for p in cache_file.parent.iterdir()] == ["cache.json"]
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
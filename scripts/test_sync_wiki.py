@@ -5,7 +5,12 @@ from __future__ import annotations
 
 import importlib.util
 import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
 
 # Import sync-wiki.py (hyphenated module name requires special handling)
 spec = importlib.util.spec_from_file_location(
@@ -26,58 +31,30 @@ import check_wiki_links
 
 _split_wiki_link_on_pipe = check_wiki_links._split_wiki_link_on_pipe
 extract_wiki_links = check_wiki_links.extract_wiki_links
+find_unconverted_links = check_wiki_links.find_unconverted_links
 
+_MISSING = object()
 
-class TestIsInTableRow:
-    """Tests for the is_in_table_row function."""
 
-    def test_normal_table_row(self) -> None:
-        """Links in normal table rows should be detected."""
-        content = "| Link | Description |\n| --- | --- |\n| [[Page]] | text |"
-        # Position of [[Page]] is at the third line
-        position = content.find("[[Page]]")
-        assert is_in_table_row(content, position) is True
-
-    def test_header_row(self) -> None:
-        """Links in table header rows should be detected."""
-        content = "| [[Link]] | Description |\n| --- | --- |"
-        position = content.find("[[Link]]")
-        assert is_in_table_row(content, position) is True
-
-    def test_separator_row_excluded(self) -> None:
-        """Separator rows (| --- | --- |) should not be detected as table content."""
-        content = "| Header |\n| --- |\n| Cell |"
-        # Position in the separator row
-        position = content.find("| --- |")
-        assert is_in_table_row(content, position) is False
-
-    def test_non_table_content(self) -> None:
-        """Content not in tables should not be detected."""
-        content = "This is [[Page]] not in a table."
-        position = content.find("[[Page]]")
-        assert is_in_table_row(content, position) is False
-
-    def test_bullet_list(self) -> None:
-        """Bullet lists should not be detected as tables."""
-        content = "- [[Page]] in a list"
-        position = content.find("[[Page]]")
-        assert is_in_table_row(content, position) is False
-
-    def test_numbered_list(self) -> None:
-        """Numbered lists should not be detected as tables."""
-        content = "1. [[Page]] in a numbered list"
-        position = content.find("[[Page]]")
-        assert is_in_table_row(content, position) is False
-
-    def test_indented_table(self) -> None:
-        """Indented tables should still be detected."""
-        content = "  | [[Page]] | Description |"
-        position = content.find("[[Page]]")
-        assert is_in_table_row(content, position) is True
-
-    def test_multiline_document(self) -> None:
-        """Test correct detection in multiline documents."""
-        content = """# Header
+@contextmanager
+def patch_wiki_structure(entries: dict[str, str]) -> Iterator[None]:
+    """Temporarily add or override WIKI_STRUCTURE entries.
+
+    Only the patched keys are saved and restored, rather than the whole map.
+    """
+    saved = {key: sync_wiki.WIKI_STRUCTURE.get(key, _MISSING) for key in entries}
+    sync_wiki.WIKI_STRUCTURE.update(entries)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is _MISSING:
+                del sync_wiki.WIKI_STRUCTURE[key]
+            else:
+                sync_wiki.WIKI_STRUCTURE[key] = value
+
+
+MULTILINE_DOCUMENT = """# Header
 
 Some text with [[Link1]] not in table.
 
@@ -87,53 +64,85 @@ Some text with [[Link1]] not in table.
 
 More text with [[Link3]] not in table.
 """
-        # Link1 - not in table
-        pos1 = content.find("[[Link1]]")
-        assert is_in_table_row(content, pos1) is False
-
-        # Link2 - in table
-        pos2 = content.find("[[Link2]]")
-        assert is_in_table_row(content, pos2) is True
-
-        # Link3 - not in table
-        pos3 = content.find("[[Link3]]")
-        assert is_in_table_row(content, pos3) is False
-
-    def test_table_without_leading_pipe(self) -> None:
-        """Tables without leading pipe (non-standard) should not be detected."""
-        # Note: GFM standard requires leading |, but some parsers are lenient
-        content = "Cell1 | Cell2 |"
-        position = 0
-        assert is_in_table_row(content, position) is False
-
-    def test_separator_row_with_alignment(self) -> None:
-        """Separator rows with alignment markers should be excluded."""
-        content = "| Header |\n| :---: |\n| Cell |"
-        position = content.find("| :---: |")
-        assert is_in_table_row(content, position) is False
-
-    def test_empty_line(self) -> None:
-        """Empty lines should not be detected as table rows."""
-        content = "| Header |\n\n| Cell |"
-        # Position at the empty line
-        position = content.find("\n\n") + 1
-        assert is_in_table_row(content, position) is False
-
-    def test_table_row_with_separator_chars_as_content(self) -> None:
-        """Table rows with separator chars as content should be detected as table rows.
-
-        This tests the edge case where a cell contains only characters that could
-        appear in a separator row (-, :, space) but is actually content.
-        """
-        # Row with single dash and colon as content - should be detected as table row
-        content = "| Header | Type |\n| --- | --- |\n| - | : |"
-        position = content.rfind("| - |")
-        assert is_in_table_row(content, position) is True
-
-        # Row with just dashes but less than 3 consecutive - should be table row
-        content2 = "| A | B |\n| --- | --- |\n| -- | - |"
-        position2 = content2.rfind("| -- |")
-        assert is_in_table_row(content2, position2) is True
+
+
+def _table_row_case(case_id: str, content: str, needle: str, expected: bool) -> Any:
+    """Build an is_in_table_row case, locating needle once at collection time."""
+    return pytest.param(content, content.find(needle), expected, id=case_id)
+
+
+IS_IN_TABLE_ROW_CASES = [
+    # Links in normal table rows should be detected
+    _table_row_case(
+        "normal_table_row",
+        "| Link | Description |\n| --- | --- |\n| [[Page]] | text |",
+        "[[Page]]",
+        True,
+    ),
+    # Links in table header rows should be detected
+    _table_row_case(
+        "header_row", "| [[Link]] | Description |\n| --- | --- |", "[[Link]]", True
+    ),
+    # Separator rows (| --- | --- |) should not be detected as table content
+    _table_row_case(
+        "separator_row_excluded", "| Header |\n| --- |\n| Cell |", "| --- |", False
+    ),
+    # Content not in tables should not be detected
+    _table_row_case(
+        "non_table_content", "This is [[Page]] not in a table.", "[[Page]]", False
+    ),
+    # Bullet lists should not be detected as tables
+    _table_row_case("bullet_list", "- [[Page]] in a list", "[[Page]]", False),
+    # Numbered lists should not be detected as tables
+    _table_row_case(
+        "numbered_list", "1. [[Page]] in a numbered list", "[[Page]]", False
+    ),
+    # Indented tables should still be detected
+    _table_row_case("indented_table", "  | [[Page]] | Description |", "[[Page]]", True),
+    # Correct detection on each line of a multiline document
+    _table_row_case("multiline_document_text", MULTILINE_DOCUMENT, "[[Link1]]", False),
+    _table_row_case("multiline_document_table", MULTILINE_DOCUMENT, "[[Link2]]", True),
+    _table_row_case(
+        "multiline_document_after_table", MULTILINE_DOCUMENT, "[[Link3]]", False
+    ),
+    # Tables without leading pipe (non-standard) should not be detected.
+    # Note: GFM standard requires leading |, but some parsers are lenient
+    _table_row_case("table_without_leading_pipe", "Cell1 | Cell2 |", "Cell1", False),
+    # Separator rows with alignment markers should be excluded
+    _table_row_case(
+        "separator_row_with_alignment",
+        "| Header |\n| :---: |\n| Cell |",
+        "| :---: |",
+        False,
+    ),
+    # Empty lines should not be detected as table rows (the needle starts
+    # with the newline that ends the empty line)
+    _table_row_case("empty_line", "| Header |\n\n| Cell |", "\n| Cell", False),
+    # Rows whose cells hold only separator characters (-, :, space) but fewer
+    # than 3 consecutive dashes are content, so they are table rows
+    _table_row_case(
+        "separator_chars_as_content",
+        "| Header | Type |\n| --- | --- |\n| - | : |",
+        "| - |",
+        True,
+    ),
+    _table_row_case(
+        "short_dashes_as_content",
+        "| A | B |\n| --- | --- |\n| -- | - |",
+        "| -- |",
+        True,
+    ),
+]
+
+
+class TestIsInTableRow:
+    """Tests for the is_in_table_row function."""
+
+    @pytest.mark.parametrize("content,position,expected", IS_IN_TABLE_ROW_CASES)
+    def test_is_in_table_row(self, content: str, position: int, expected: bool) -> None:
+        """Each case's position should be classified as expected."""
+        assert position != -1
+        assert is_in_table_row(content, position) is expected
 
     def test_separator_row_requires_three_dashes_in_each_cell(self) -> None:
         """Per GFM spec, each cell in a separator row must have at least 3 consecutive dashes."""
@@ -161,60 +170,40 @@ class TestConvertLinksShortFormat:
     def test_matching_display_text_uses_short_format(self) -> None:
         """When link text matches wiki page name, use short format [[PageName]]."""
         content = "[Coroutines](./05-coroutines.md) - Time-based operations"
-        original_structure = sync_wiki.WIKI_STRUCTURE.copy()
-        try:
-            sync_wiki.WIKI_STRUCTURE["05-coroutines.md"] = "Coroutines"
+        with patch_wiki_structure({"05-coroutines.md": "Coroutines"}):
             result = convert_links(content, "best-practices/README.md")
             # Should use short format since "Coroutines" == "Coroutines"
             assert "[[Coroutines]]" in result
             # Should NOT have redundant format
             assert "[[Coroutines|Coroutines]]" not in result
-        finally:
-            sync_wiki.WIKI_STRUCTURE.clear()
-            sync_wiki.WIKI_STRUCTURE.update(original_structure)
 
     def test_different_display_text_uses_long_format(self) -> None:
         """When link text differs from wiki page name, use long format."""
         content = "[Performance & Memory](./07-performance-memory.md) - GC tips"
-        original_structure = sync_wiki.WIKI_STRUCTURE.copy()
-        try:
-            sync_wiki.WIKI_STRUCTURE["07-performance-memory.md"] = (
-                "Performance-and-Memory"
-            )
+        with patch_wiki_structure(
+            {"07-performance-memory.md": "Performance-and-Memory"}
+        ):
             result = convert_links(content, "best-practices/README.md")
             # Should use long format since display text differs
             assert "[[Performance & Memory|Performance-and-Memory]]" in result
-        finally:
-            sync_wiki.WIKI_STRUCTURE.clear()
-            sync_wiki.WIKI_STRUCTURE.update(original_structure)
 
     def test_short_format_with_anchor(self) -> None:
         """Short format should work correctly with anchors."""
         content = "[Coroutines](./05-coroutines.md#starting-coroutines) - Start tips"
-        original_structure = sync_wiki.WIKI_STRUCTURE.copy()
-        try:
-            sync_wiki.WIKI_STRUCTURE["05-coroutines.md"] = "Coroutines"
+        with patch_wiki_structure({"05-coroutines.md": "Coroutines"}):
             result = convert_links(content, "best-practices/README.md")
             # Should use short format with anchor
             assert "[[Coroutines#starting-coroutines]]" in result
             assert "[[Coroutines|Coroutines#" not in result
-        finally:
-            sync_wiki.WIKI_STRUCTURE.clear()
-            sync_wiki.WIKI_STRUCTURE.update(original_structure)
 
     def test_table_context_matching_text_uses_short_format(self) -> None:
         """In tables, matching display text should still use short format (no pipe needed)."""
         content = "| [Coroutines](./05-coroutines.md) | Description |\n| --- | --- |"
-        original_structure = sync_wiki.WIKI_STRUCTURE.copy()
-        try:
-            sync_wiki.WIKI_STRUCTURE["05-coroutines.md"] = "Coroutines"
+        with patch_wiki_structure({"05-coroutines.md": "Coroutines"}):
             result = convert_links(content, "best-practices/README.md")
             # Should use short format even in tables since no pipe is needed
             assert "[[Coroutines]]" in result
             assert "[[Coroutines\\|Coroutines]]" not in result
-        finally:
-            sync_wiki.WIKI_STRUCTURE.clear()
-            sync_wiki.WIKI_STRUCTURE.update(original_structure)
 
 
 class TestConvertLinksTableIntegration:
@@ -225,31 +214,21 @@ class TestConvertLinksTableIntegration:
         # Link from README.md to docs/tool.md resolves to "tool" after stripping docs/ prefix
         content = "| [Tool](./docs/tool.md) | Description |\n| --- | --- |"
         # Mock the WIKI_STRUCTURE for this test
-        original_structure = sync_wiki.WIKI_STRUCTURE.copy()
-        try:
-            # Key is "tool.md" because path resolves to "docs/tool.md",
-            # then docs/ is stripped, leaving "tool.md"
-            sync_wiki.WIKI_STRUCTURE["tool.md"] = "Tool-Page"
+        # Key is "tool.md" because path resolves to "docs/tool.md",
+        # then docs/ is stripped, leaving "tool.md"
+        with patch_wiki_structure({"tool.md": "Tool-Page"}):
             result = convert_links(content, "README.md")
             # Should have escaped pipe in table
             assert "[[Tool\\|Tool-Page]]" in result
-        finally:
-            sync_wiki.WIKI_STRUCTURE.clear()
-            sync_wiki.WIKI_STRUCTURE.update(original_structure)
 
     def test_link_outside_table_gets_normal_pipe(self) -> None:
         """Links outside tables should have normal pipes in wiki format."""
         content = "Check out [Tool](./docs/tool.md) for more info."
-        original_structure = sync_wiki.WIKI_STRUCTURE.copy()
-        try:
-            sync_wiki.WIKI_STRUCTURE["tool.md"] = "Tool-Page"
+        with patch_wiki_structure({"tool.md": "Tool-Page"}):
             result = convert_links(content, "README.md")
             # Should have normal pipe outside table
             assert "[[Tool|Tool-Page]]" in result
             assert "\\|" not in result
-        finally:
-            sync_wiki.WIKI_STRUCTURE.clear()
-            sync_wiki.WIKI_STRUCTURE.update(original_structure)
 
     def test_mixed_table_and_non_table_links(self) -> None:
         """Document with both table and non-table links should handle both correctly."""
@@ -264,11 +243,13 @@ See [Overview](./docs/overview.md) for details.
 
 More info at [Tool1](./docs/tool1.md).
 """
-        original_structure = sync_wiki.WIKI_STRUCTURE.copy()
-        try:
-            sync_wiki.WIKI_STRUCTURE["overview.md"] = "Overview"
-            sync_wiki.WIKI_STRUCTURE["tool1.md"] = "Tool1-Page"
-            sync_wiki.WIKI_STRUCTURE["tool2.md"] = "Tool2-Page"
+        with patch_wiki_structure(
+            {
+                "overview.md": "Overview",
+                "tool1.md": "Tool1-Page",
+                "tool2.md": "Tool2-Page",
+            }
+        ):
             result = convert_links(content, "README.md")
 
             # Non-table links with matching display text use short format
@@ -282,9 +263,6 @@ More info at [Tool1](./docs/tool1.md).
             # Count occurrences - should be 1 escaped (in table) and 1 normal (outside)
             assert result.count("[[Tool1\\|Tool1-Page]]") == 1
             assert result.count("[[Tool1|Tool1-Page]]") == 1
-        finally:
-            sync_wiki.WIKI_STRUCTURE.clear()
-            sync_wiki.WIKI_STRUCTURE.update(original_structure)
 
 
 class TestStripMarkdownFormatting:
@@ -350,48 +328,33 @@ class TestConvertLinksStripsFormatting:
     def test_bold_link_text_stripped(self) -> None:
         """Bold formatting inside link text should be stripped."""
         content = "[**Coroutines**](./05-coroutines.md) - Time-based operations"
-        original_structure = sync_wiki.WIKI_STRUCTURE.copy()
-        try:
-            sync_wiki.WIKI_STRUCTURE["05-coroutines.md"] = "Coroutines"
+        with patch_wiki_structure({"05-coroutines.md": "Coroutines"}):
             result = convert_links(content, "best-practices/README.md")
             # Should use short format since stripped text matches
             assert "[[Coroutines]]" in result
             # Should NOT have bold markers inside the link
             assert "[[**Coroutines**" not in result
-        finally:
-            sync_wiki.WIKI_STRUCTURE.clear()
-            sync_wiki.WIKI_STRUCTURE.update(original_structure)
 
     def test_bold_link_with_different_page_name(self) -> None:
         """Bold formatting stripped, but different display text preserved."""
         content = "[**Lifecycle Methods**](./01-lifecycle-methods.md)"
-        original_structure = sync_wiki.WIKI_STRUCTURE.copy()
-        try:
-            sync_wiki.WIKI_STRUCTURE["01-lifecycle-methods.md"] = "Lifecycle-Methods"
+        with patch_wiki_structure({"01-lifecycle-methods.md": "Lifecycle-Methods"}):
             result = convert_links(content, "best-practices/README.md")
             # Should use long format with clean display text
             assert "[[Lifecycle Methods|Lifecycle-Methods]]" in result
             # Should NOT have bold markers
             assert "**" not in result
-        finally:
-            sync_wiki.WIKI_STRUCTURE.clear()
-            sync_wiki.WIKI_STRUCTURE.update(original_structure)
 
     def test_whitespace_after_stripping_is_trimmed(self) -> None:
         """Whitespace left after stripping formatting should be trimmed."""
         content = "[** Coroutines **](./05-coroutines.md)"
-        original_structure = sync_wiki.WIKI_STRUCTURE.copy()
-        try:
-            sync_wiki.WIKI_STRUCTURE["05-coroutines.md"] = "Coroutines"
+        with patch_wiki_structure({"05-coroutines.md": "Coroutines"}):
             result = convert_links(content, "best-practices/README.md")
             # Should use short format after trimming whitespace
             assert "[[Coroutines]]" in result
             # Should NOT have leading/trailing whitespace in link
             assert "[[ Coroutines" not in result
             assert "Coroutines ]]" not in result
-        finally:
-            sync_wiki.WIKI_STRUCTURE.clear()
-            sync_wiki.WIKI_STRUCTURE.update(original_structure)
 
 
 class TestSplitWikiLinkOnPipe:
@@ -491,171 +454,69 @@ class TestExtractWikiLinks:
         assert links[1].line_num == 4
 
 
-def run_tests() -> int:
-    """Run all tests and return exit code."""
-    test_instance = TestIsInTableRow()
-    short_format_instance = TestConvertLinksShortFormat()
-    integration_instance = TestConvertLinksTableIntegration()
-    strip_formatting_instance = TestStripMarkdownFormatting()
-    convert_strips_instance = TestConvertLinksStripsFormatting()
-    split_pipe_instance = TestSplitWikiLinkOnPipe()
-    extract_links_instance = TestExtractWikiLinks()
-    tests = [
-        # TestIsInTableRow tests
-        (test_instance.test_normal_table_row, "normal_table_row"),
-        (test_instance.test_header_row, "header_row"),
-        (test_instance.test_separator_row_excluded, "separator_row_excluded"),
-        (test_instance.test_non_table_content, "non_table_content"),
-        (test_instance.test_bullet_list, "bullet_list"),
-        (test_instance.test_numbered_list, "numbered_list"),
-        (test_instance.test_indented_table, "indented_table"),
-        (test_instance.test_multiline_document, "multiline_document"),
-        (test_instance.test_table_without_leading_pipe, "table_without_leading_pipe"),
-        (
-            test_instance.test_separator_row_with_alignment,
-            "separator_row_with_alignment",
-        ),
-        (test_instance.test_empty_line, "empty_line"),
-        (
-            test_instance.test_table_row_with_separator_chars_as_content,
-            "table_row_with_separator_chars_as_content",
-        ),
-        (
-            test_instance.test_separator_row_requires_three_dashes_in_each_cell,
-            "separator_row_requires_three_dashes_in_each_cell",
-        ),
-        # TestConvertLinksShortFormat tests
-        (
-            short_format_instance.test_matching_display_text_uses_short_format,
-            "short_format_matching_display_text",
-        ),
-        (
-            short_format_instance.test_different_display_text_uses_long_format,
-            "short_format_different_display_text",
-        ),
-        (
-            short_format_instance.test_short_format_with_anchor,
-            "short_format_with_anchor",
-        ),
-        (
-            short_format_instance.test_table_context_matching_text_uses_short_format,
-            "short_format_in_table_context",
-        ),
-        # TestConvertLinksTableIntegration tests
-        (
-            integration_instance.test_link_in_table_gets_escaped_pipe,
-            "integration_link_in_table_escaped",
-        ),
-        (
-            integration_instance.test_link_outside_table_gets_normal_pipe,
-            "integration_link_outside_table_normal",
-        ),
-        (
-            integration_instance.test_mixed_table_and_non_table_links,
-            "integration_mixed_table_and_non_table",
-        ),
-        # TestStripMarkdownFormatting tests
-        (
-            strip_formatting_instance.test_bold_double_asterisk,
-            "strip_formatting_bold_asterisk",
-        ),
-        (
-            strip_formatting_instance.test_bold_double_underscore,
-            "strip_formatting_bold_underscore",
-        ),
-        (
-            strip_formatting_instance.test_italic_single_asterisk,
-            "strip_formatting_italic_asterisk",
-        ),
-        (
-            strip_formatting_instance.test_italic_single_underscore,
-            "strip_formatting_italic_underscore",
-        ),
-        (
-            strip_formatting_instance.test_preserves_snake_case,
-            "strip_formatting_preserves_snake_case",
-        ),
-        (
-            strip_formatting_instance.test_mixed_formatting,
-            "strip_formatting_mixed",
-        ),
-        (
-            strip_formatting_instance.test_no_formatting,
-            "strip_formatting_plain_text",
-        ),
-        (
-            strip_formatting_instance.test_nested_formatting,
-            "strip_formatting_nested",
-        ),
-        (
-            strip_formatting_instance.test_multiple_occurrences,
-            "strip_formatting_multiple",
-        ),
-        (
-            strip_formatting_instance.test_empty_formatting_markers,
-            "strip_formatting_empty_markers",
-        ),
-        (
-            strip_formatting_instance.test_whitespace_inside_formatting,
-            "strip_formatting_whitespace",
-        ),
-        # TestConvertLinksStripsFormatting tests
-        (
-            convert_strips_instance.test_bold_link_text_stripped,
-            "convert_links_strips_bold",
-        ),
-        (
-            convert_strips_instance.test_bold_link_with_different_page_name,
-            "convert_links_strips_bold_different_page",
-        ),
-        (
-            convert_strips_instance.test_whitespace_after_stripping_is_trimmed,
-            "convert_links_strips_whitespace",
-        ),
-        # TestSplitWikiLinkOnPipe tests
-        (split_pipe_instance.test_no_pipe, "split_pipe_no_pipe"),
-        (split_pipe_instance.test_simple_pipe, "split_pipe_simple"),
-        (split_pipe_instance.test_escaped_pipe, "split_pipe_escaped"),
-        (
-            split_pipe_instance.test_escaped_pipe_with_anchor,
-            "split_pipe_escaped_anchor",
-        ),
-        (split_pipe_instance.test_multiple_pipes_uses_last, "split_pipe_multiple"),
-        (split_pipe_instance.test_page_name_only_with_anchor, "split_pipe_anchor_only"),
-        # TestExtractWikiLinks tests
-        (extract_links_instance.test_normal_link_extraction, "extract_links_normal"),
-        (extract_links_instance.test_link_with_display_text, "extract_links_display"),
-        (extract_links_instance.test_escaped_pipe_link, "extract_links_escaped_pipe"),
-        (extract_links_instance.test_link_with_anchor, "extract_links_anchor"),
-        (
-            extract_links_instance.test_escaped_pipe_with_anchor,
-            "extract_links_escaped_anchor",
-        ),
-        (
-            extract_links_instance.test_multiline_content_line_numbers,
-            "extract_links_line_numbers",
-        ),
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test_func, name in tests:
-        try:
-            test_func()
-            print(f"  ✓ {name}")
-            passed += 1
-        except AssertionError as e:
-            print(f"  ✗ {name}: {e}")
-            failed += 1
-        except Exception as e:
-            print(f"  ✗ {name}: unexpected error: {e}")
-            failed += 1
-
-    print(f"\n{passed} passed, {failed} failed")
-    return 0 if failed == 0 else 1
+class TestMalformedInputPerformance:
+    """Malformed documents must not trigger quadratic link scanning."""
+
+    # Inputs are sized so the quadratic versions take tens of seconds while
+    # the linear ones take milliseconds; the budget sits far from both so a
+    # busy runner cannot fail a linear scan.
+    TIME_BUDGET_SECONDS = 2.0
+
+    def test_convert_links_unclosed_brackets(self) -> None:
+        """Thousands of unclosed brackets should be scanned in linear time."""
+        # The "(" keeps convert_links from skipping the link scan entirely
+        content = "[" * 50000 + "("
+        start = time.perf_counter()
+        result = convert_links(content, "x.md")
+        elapsed = time.perf_counter() - start
+        assert result == content
+        assert elapsed < self.TIME_BUDGET_SECONDS
+
+    def test_find_unconverted_links_unclosed_brackets(self) -> None:
+        """Unconverted-link detection should not rescan from every bracket."""
+        content = "[" * 50000 + "[a](./" + "a.md" * 12500
+        start = time.perf_counter()
+        result = find_unconverted_links(content, Path("x.md"))
+        elapsed = time.perf_counter() - start
+        assert result == []
+        assert elapsed < self.TIME_BUDGET_SECONDS
+
+    def test_find_unconverted_links_still_detects_links(self) -> None:
+        """The linear scanner should match the same links as before."""
+        content = "[[x [Guide](../guide.md#intro) and [ext](./a.md)"
+        result = find_unconverted_links(content, Path("x.md"))
+        assert result == [("../guide.md#intro", 1), ("./a.md", 1)]
+
+    def test_find_unconverted_links_many_lines(self) -> None:
+        """Line numbers should not be recounted from the top for every link."""
+        content = "[a](./a.md) text\n" * 60000
+        start = time.perf_counter()
+        result = find_unconverted_links(content, Path("x.md"))
+        elapsed = time.perf_counter() - start
+        assert len(result) == 60000
+        assert result[-1] == ("./a.md", 60000)
+        assert elapsed < self.TIME_BUDGET_SECONDS
+
+    def test_extract_wiki_links_unclosed_brackets(self) -> None:
+        """Runs of [[ without a closing ]] should be scanned in linear time."""
+        # A lone "]" makes every [[ a failed candidate that a regex rescans
+        content = "[[" * 50000 + "x] [[Page]]"
+        start = time.perf_counter()
+        result = extract_wiki_links(content)
+        elapsed = time.perf_counter() - start
+        assert [link.page_name for link in result] == ["Page"]
+        assert elapsed < self.TIME_BUDGET_SECONDS
+
+    def test_extract_wiki_links_many_lines(self) -> None:
+        """Line numbers should not be recounted from the top for every link."""
+        content = "[[Page]]\n" * 100000
+        start = time.perf_counter()
+        result = extract_wiki_links(content)
+        elapsed = time.perf_counter() - start
+        assert len(result) == 100000
+        assert result[-1].line_num == 100000
+        assert elapsed < self.TIME_BUDGET_SECONDS
 
 
 if __name__ == "__main__":
-    print("Running sync-wiki tests...")
-    raise SystemExit(run_tests())
+    raise SystemExit(pytest.main([__file__, "-q"]))
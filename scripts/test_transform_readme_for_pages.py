@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Tests for transform_readme_for_pages.py functionality."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from transform_readme_for_pages import process_file, transform_links
+
+TRANSFORM_LINKS_CASES = [
+    pytest.param("[Guide](docs/guide.md)", "[Guide](guide.md)", id="docs_prefix"),
+    pytest.param("[x](./docs/x.md)", "[x](./x.md)", id="dot_docs_prefix"),
+    pytest.param("[docs/a.md](docs/a.md)", "[docs/a.md](a.md)", id="text_repeats_href"),
+    pytest.param(
+        "[a](<./docs/a b.md>)", "[a](<./a b.md>)", id="angle_bracket_destination"
+    ),
+    pytest.param('[a](docs/a.md "title")', '[a](a.md "title")', id="with_title"),
+    pytest.param(
+        '[a](docs/a.md "docs/a.md")', '[a](a.md "docs/a.md")', id="title_repeats_href"
+    ),
+    pytest.param(
+        "[a](docs/a%20b.md#top)", "[a](a%20b.md#top)", id="keeps_encoding_and_anchor"
+    ),
+    pytest.param(
+        "[x](https://example.com/docs/x.md)",
+        "[x](https://example.com/docs/x.md)",
+        id="external_url_untouched",
+    ),
+    pytest.param(
+        "[a](docs/a.md) and [b](./docs/b.md)",
+        "[a](a.md) and [b](./b.md)",
+        id="several_links",
+    ),
+]
+
+
+class TestTransformLinks:
+    """Tests for stripping the docs/ prefix from link destinations."""
+
+    @pytest.mark.parametrize("content, expected", TRANSFORM_LINKS_CASES)
+    def test_transform_links(self, content: str, expected: str) -> None:
+        assert transform_links(content) == expected
+
+
+class TestProcessFile:
+    """Tests for writing transformed or unchanged files."""
+
+    def test_unchanged_file_is_copied_to_output(self, tmp_path: Path) -> None:
+        source = tmp_path / "README.md"
+        source.write_bytes(b"# Title\r\n\r\n[Site](https://example.com)\r\n")
+        output = tmp_path / "out.md"
+
+        assert process_file(source, output) is False
+        assert output.read_bytes() == source.read_bytes()
+
+    def test_unchanged_file_with_output_aliasing_input(self, tmp_path: Path) -> None:
+        (tmp_path / "sub").mkdir()
+        source = tmp_path / "README.md"
+        source.write_text("# Title\n", encoding="utf-8")
+        alias = tmp_path / "sub" / ".." / "README.md"
+
+        assert process_file(source, alias) is False
+        assert source.read_text(encoding="utf-8") == "# Title\n"
+
+    def test_changed_file_written_to_output(self, tmp_path: Path) -> None:
+        source = tmp_path / "README.md"
+        source.write_text("[Guide](docs/guide.md)\n", encoding="utf-8")
+        output = tmp_path / "out.md"
+
+        assert process_file(source, output) is True
+        assert output.read_text(encoding="utf-8") == "[Guide](guide.md)\n"
+        assert source.read_text(encoding="utf-8") == "[Guide](docs/guide.md)\n"
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -14,13 +14,22 @@ from __future__ import annotations
 
 import argparse
 import re
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Iterable, Optional, Sequence
 from urllib.parse import unquote
 
 from link_utils import extract_links
 
+# Thread count for transforming a batch of files concurrently
+IO_WORKERS = 8
+
+# Pattern to detect docs/ prefix in hrefs
+# Matches: ./docs/path or docs/path (with optional ./ prefix)
+DOCS_PREFIX_PATTERN = re.compile(r"^(\./)?docs/(.+)$")
+
 
 def transform_links(content: str) -> str:
     """Transform docs/ prefixed links to work on GitHub Pages.
@@ -28,22 +37,26 @@ def transform_links(content: str) -> str:
     Uses link_utils.extract_links for robust link extraction that properly
     handles escaped brackets, nested brackets, and other edge cases.
     """
-    # Pattern to detect docs/ prefix in hrefs
-    # Matches: ./docs/path or docs/path (with optional ./ prefix)
-    docs_prefix_pattern = re.compile(r"^(\./)?docs/(.+)$")
+    # Only hrefs that literally start with docs/ or ./docs/ are rewritten, so
+    # content without that substring needs no link scan at all
+    if "docs/" not in content:
+        return content
 
     # Extract all links using the robust link_utils parser
     links = extract_links(content)
 
-    # Process links in reverse order to preserve string positions
-    result = content
-    for link in reversed(links):
+    # Rewritten hrefs are collected as pieces between the untouched spans
+    # (extract_links yields links in document order) and joined once, rather
+    # than re-slicing the whole content for every link
+    pieces: list[str] = []
+    cursor = 0
+    for link in links:
         if link.kind != "inline":
             continue
 
         # URL-decode href for pattern matching (handles %20, etc.)
         href_decoded = unquote(link.href)
-        match = docs_prefix_pattern.match(href_decoded)
+        match = DOCS_PREFIX_PATTERN.match(href_decoded)
         if not match:
             continue
 
@@ -59,14 +72,22 @@ def transform_links(content: str) -> str:
             # Shouldn't happen if pattern matched, but handle gracefully
             continue
 
-        # Reconstruct the link with the new href
+        # Splice the new href in at its known position
         # Original segment format: [text](href) or [text]( href "title" )
-        old_segment = link.segment
-        new_segment = old_segment.replace(link.href, new_href, 1)
+        # The destination is the text before the closing ")", and the href is
+        # its first occurrence there (only whitespace or "<" can precede it),
+        # so link text that happens to repeat the href is left alone
+        dest_start = link.end - 1 - len(link.dest_content)
+        href_start = dest_start + link.dest_content.find(original_href)
 
-        result = result[: link.start] + new_segment + result[link.end :]
+        pieces.append(content[cursor:href_start])
+        pieces.append(new_href)
+        cursor = href_start + len(original_href)
 
-    return result
+    if not pieces:
+        return content
+    pieces.append(content[cursor:])
+    return "".join(pieces)
 
 
 def process_file(input_path: Path, output_path: Optional[Path] = None) -> bool:
@@ -80,7 +101,7 @@ def process_file(input_path: Path, output_path: Optional[Path] = None) -> bool:
         True if changes were made, False otherwise
     """
     try:
-        content = input_path.read_text(encoding="utf-8")
+        content = input_path.read_bytes().decode("utf-8")
     except Exception as e:
         print(f"Error reading {input_path}: {e}", file=sys.stderr)
         return False
@@ -88,25 +109,70 @@ def process_file(input_path: Path, output_path: Optional[Path] = None) -> bool:
     transformed = transform_links(content)
 
     if content == transformed:
-        # No changes needed
+        # No changes needed; copy the bytes across instead of re-encoding
         if output_path and output_path != input_path:
-            output_path.write_text(content, encoding="utf-8")
+            try:
+                shutil.copyfile(input_path, output_path)
+            except shutil.SameFileError:
+                pass  # Output is the input under another spelling
         return False
 
+    # Encode once and write the bytes directly; like the unchanged-file copy
+    # above, this keeps the input's line endings on every platform
+    data = transformed.encode("utf-8")
     if output_path is None:
-        print(transformed, end="")
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
     else:
-        output_path.write_text(transformed, encoding="utf-8")
+        output_path.write_bytes(data)
 
     return True
 
 
+def report_result(input_path: Path, changed: bool) -> None:
+    """Print whether a file's links were transformed."""
+    if changed:
+        print(f"Transformed links in {input_path}", file=sys.stderr)
+    else:
+        print(f"No changes needed in {input_path}", file=sys.stderr)
+
+
+def transform_paths(paths: Iterable[Path], quiet: bool = False) -> int:
+    """Transform several files in place within a single process.
+
+    Batch callers avoid paying interpreter startup and argument parsing
+    once per file, and the files are processed concurrently.
+
+    Returns:
+        Number of files that were changed
+    """
+    paths = list(paths)
+    if len(paths) > 1:
+        # Files are independent; overlap their reads and writes, then report
+        # in the order given
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+            results = list(executor.map(process_file, paths, paths))
+    else:
+        results = [process_file(path, path) for path in paths]
+
+    if not quiet:
+        for path, changed in zip(paths, results):
+            report_result(path, changed)
+    return sum(results)
+
+
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
         description="Transform README.md links for GitHub Pages"
     )
-    parser.add_argument("input", type=Path, help="Input file to transform")
+    parser.add_argument(
+        "input",
+        type=Path,
+        nargs="+",
+        help="Input file(s) to transform (several require --in-place)",
+    )
     parser.add_argument(
         "-o",
         "--output",
@@ -125,7 +191,10 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Don't print status messages",
     )
-    return parser.parse_args(argv)
+    args = parser.parse_args(argv)
+    if len(args.input) > 1 and not args.in_place:
+        parser.error("multiple input files require --in-place")
+    return args
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
@@ -133,17 +202,14 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     args = parse_args(argv)
 
     if args.in_place:
-        output = args.input
-    else:
-        output = args.output
+        transform_paths(args.input, quiet=args.quiet)
+        return 0
 
-    changed = process_file(args.input, output)
+    input_path = args.input[0]
+    changed = process_file(input_path, args.output)
 
     if not args.quiet:
-        if changed:
-            print(f"Transformed links in {args.input}", file=sys.stderr)
-        else:
-            print(f"No changes needed in {args.input}", file=sys.stderr)
+        report_result(input_path, changed)
 
     return 0
 
@@ -12,6 +12,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+import check_wiki_links
+
 
 def main() -> int:
     """Run wiki sync and validation."""
@@ -21,7 +23,9 @@ def main() -> int:
     env = os.environ.copy()
     env["PYTHONPATH"] = str(scripts_dir)
 
-    # Run sync-wiki.py
+    # Run sync-wiki.py as its own program: its process pool pickles
+    # conversion functions by module, which only resolves for the script
+    # run as __main__ on platforms that spawn workers
     result = subprocess.run(
         [sys.executable, scripts_dir / "sync-wiki.py"],
         env=env,
@@ -30,14 +34,12 @@ def main() -> int:
         print("Wiki sync failed", file=sys.stderr)
         return result.returncode
 
-    # Run check_wiki_links.py
-    result = subprocess.run(
-        [sys.executable, scripts_dir / "check_wiki_links.py"],
-        env=env,
-    )
-    if result.returncode != 0:
+    # Run check_wiki_links in this process; unlike the sync it needs no
+    # worker processes, so a second interpreter start buys nothing
+    returncode = check_wiki_links.main()
+    if returncode != 0:
         print("Wiki link validation failed", file=sys.stderr)
-        return result.returncode
+        return returncode
 
     return 0
 